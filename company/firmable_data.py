@@ -3,13 +3,6 @@ import logging
 import requests
 from dotenv import load_dotenv
 
-# -------------------------------------------------------------------
-# Logging configuration
-# -------------------------------------------------------------------
-logging.basicConfig(
-    level=logging.INFO,
-    format="%(asctime)s | %(levelname)s | %(name)s | %(message)s",
-)
 logger = logging.getLogger(__name__)
 
 load_dotenv()
@@ -17,10 +10,13 @@ load_dotenv()
 FIRMABLE_API_KEY = os.getenv("FIRMABLE_API_KEY")
 BASE_URL = "https://api.firmable.com/company"
 
-def get_company_info(url, linkedin=False):
+def get_company_info(url, linkedin=False, session=None):
     """
     Get company information from Firmable API.
 
+    Args:
+        session: Optional requests.Session to reuse pooled connections
+
     Returns:
         dict: Company info with hq_location, linkedin, industry on success
         None: On any failure (API error, missing data, etc.)
@@ -39,13 +35,15 @@ def get_company_info(url, linkedin=False):
     else:
         params = {"website": url}
 
+    http = session or requests
+
     try:
-        response = requests.get(BASE_URL, headers=headers, params=params, timeout=30)
+        response = http.get(BASE_URL, headers=headers, params=params, timeout=30)
         response.raise_for_status()
     except requests.exceptions.RequestException as e:
         # If the first attempt fails and URL doesn't end in .au, try with .com.au
         if not url.endswith('.au'):
-            logger.info(f"First Firmable request failed for {url}, trying .com.au variant")
+            logger.info("First Firmable request failed for %s, trying .com.au variant", url)
             # Replace or add .com.au suffix
             has_trailing_slash = url.endswith('/')
             base_url = url.rstrip('/')
@@ -65,13 +63,13 @@ def get_company_info(url, linkedin=False):
                 params = {"website": retry_url}
 
             try:
-                response = requests.get(BASE_URL, headers=headers, params=params, timeout=30)
+                response = http.get(BASE_URL, headers=headers, params=params, timeout=30)
                 response.raise_for_status()
             except requests.exceptions.RequestException as retry_e:
-                logger.exception(f"Firmable API retry also failed for {retry_url}: {retry_e}")
+                logger.exception("Firmable API retry also failed for %s: %s", retry_url, retry_e)
                 return None
         else:
-            logger.exception(f"Firmable API error for {url}: {e}")
+            logger.exception("Firmable API error for %s: %s", url, e)
             return None
 
     try:
@@ -87,12 +85,13 @@ def get_company_info(url, linkedin=False):
             "industry": industry
         }
 
-        logger.info(f"Successfully retrieved company info for {url}")
+        logger.info("Successfully retrieved company info for %s", url)
         return extracted
 
     except (ValueError, IndexError, KeyError) as e:
-        logger.exception(f"Error parsing Firmable response for {url}: {e}")
+        logger.exception("Error parsing Firmable response for %s: %s", url, e)
         return None
 
 if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO)
     print(get_company_info("https://www.lawinorder.com/"))
\ No newline at end of file
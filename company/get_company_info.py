@@ -2,37 +2,33 @@ import logging
 from .serp_company_url import get_company_url
 from .firmable_data import get_company_info
 
-# -------------------------------------------------------------------
-# Logging configuration
-# -------------------------------------------------------------------
-logging.basicConfig(
-    level=logging.INFO,
-    format="%(asctime)s | %(levelname)s | %(name)s | %(message)s",
-)
 logger = logging.getLogger(__name__)
 
 
-def get_info(company_name, company_location):
+def get_info(company_name, company_location, session=None):
     """
     Aggregate company information from multiple sources.
 
+    Args:
+        session: Optional requests.Session to reuse pooled connections / cached responses
+
     Returns:
         dict: Company info with all available fields on success
         None: Only if critical data (company URL) cannot be obtained
     """
     # Get company URL from SERP
-    company_url = get_company_url(company_name, company_location)
+    company_url = get_company_url(company_name, company_location, session=session)
 
     if not company_url:
-        logger.error(f"Could not find company URL for {company_name} in {company_location}")
+        logger.error("Could not find company URL for %s in %s", company_name, company_location)
         return None
 
     # Get detailed company info from Firmable
-    company_info = get_company_info(company_url)
+    company_info = get_company_info(company_url, session=session)
 
     # If Firmable fails, create a minimal info dict so workflow can continue
     if not company_info:
-        logger.warning(f"Could not get Firmable data for {company_name}, using minimal info")
+        logger.warning("Could not get Firmable data for %s, using minimal info", company_name)
         company_info = {
             "hq_location": None,
             "linkedin": None,
@@ -44,9 +40,10 @@ def get_info(company_name, company_location):
     company_info['name'] = company_name
     company_info['city'] = company_location
 
-    logger.info(f"Successfully aggregated info for {company_name}")
+    logger.info("Successfully aggregated info for %s", company_name)
     return company_info
 
 
 if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO)
     print(get_info("UrbanX", "Brisbane"))
\ No newline at end of file
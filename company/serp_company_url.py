@@ -1,30 +1,28 @@
 import os
 import logging
-import serpapi
+import requests
 from dotenv import load_dotenv
 from urllib.parse import urlparse
 
-# -------------------------------------------------------------------
-# Logging configuration
-# -------------------------------------------------------------------
-logging.basicConfig(
-    level=logging.INFO,
-    format="%(asctime)s | %(levelname)s | %(name)s | %(message)s",
-)
 logger = logging.getLogger(__name__)
 
 load_dotenv()
 API_KEY = os.getenv("SERP_API_KEY")
 
+SEARCH_URL = "https://serpapi.com/search.json"
+
 def clean_domain(url):
         if not url.startswith(('http://', 'https://')):
             url = 'https://' + url
         return urlparse(url).netloc.replace('www.', '').lower()
 
-def get_company_url(name, location):
+def get_company_url(name, location, session=None):
     """
     Get company website URL using SERP API Google search.
 
+    Args:
+        session: Optional requests.Session (e.g. the shared cached session)
+
     Returns:
         str: Company domain on success
         None: On any failure (API error, no results, etc.)
@@ -39,26 +37,30 @@ def get_company_url(name, location):
         "api_key": API_KEY
     }
 
+    http = session or requests
+
     try:
-        client = serpapi.Client(api_key=params["api_key"])
-        results = client.search(params)
+        response = http.get(SEARCH_URL, params=params, timeout=(5, 30))
+        response.raise_for_status()
+        results = response.json()
 
         if not results.get("organic_results"):
-            logger.warning(f"No search results found for {name} in {location}")
+            logger.warning("No search results found for %s in %s", name, location)
             return None
 
         link = results["organic_results"][0].get("link")
         if not link:
-            logger.warning(f"First result has no link for {name} in {location}")
+            logger.warning("First result has no link for %s in %s", name, location)
             return None
 
         domain = clean_domain(link)
-        logger.info(f"Found company URL for {name}: {domain}")
+        logger.info("Found company URL for %s: %s", name, domain)
         return domain
 
     except Exception as e:
-        logger.exception(f"SERP API error for {name} in {location}: {e}")
+        logger.exception("SERP API error for %s in %s: %s", name, location, e)
         return None
 
 if __name__ == "__main__":
+  logging.basicConfig(level=logging.INFO)
   print(get_company_url("LAB Group", "Melbourne"))
\ No newline at end of file
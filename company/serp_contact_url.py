@@ -1,25 +1,24 @@
 import os
 import logging
-import serpapi
+import requests
 from dotenv import load_dotenv
 
-logging.basicConfig(
-    level=logging.INFO,
-    format="%(asctime)s | %(levelname)s | %(name)s | %(message)s",
-)
 logger = logging.getLogger(__name__)
 
 load_dotenv()
 API_KEY = os.getenv("SERP_API_KEY")
 
+SEARCH_URL = "https://serpapi.com/search.json"
 
-def get_contact_linkedin_url(contact_name, company_name):
+
+def get_contact_linkedin_url(contact_name, company_name, session=None):
     """
     Search Google for a person's LinkedIn profile URL.
 
     Args:
         contact_name: Full name of the contact (e.g. "Nick Gannoulis")
         company_name: Company name for disambiguation (e.g. "OnQ Software")
+        session: Optional requests.Session (e.g. the shared cached session)
 
     Returns:
         str: LinkedIn profile URL on success
@@ -35,27 +34,31 @@ def get_contact_linkedin_url(contact_name, company_name):
         "api_key": API_KEY,
     }
 
+    http = session or requests
+
     try:
-        client = serpapi.Client(api_key=params["api_key"])
-        results = client.search(params)
+        response = http.get(SEARCH_URL, params=params, timeout=(5, 30))
+        response.raise_for_status()
+        results = response.json()
 
         if not results.get("organic_results"):
-            logger.warning(f"No search results for contact {contact_name} at {company_name}")
+            logger.warning("No search results for contact %s at %s", contact_name, company_name)
             return None
 
         for result in results["organic_results"][:5]:
             link = result.get("link", "")
             if "linkedin.com/in/" in link:
-                logger.info(f"Found LinkedIn URL for {contact_name}: {link}")
+                logger.info("Found LinkedIn URL for %s: %s", contact_name, link)
                 return link
 
-        logger.warning(f"No LinkedIn profile URL found in top results for {contact_name}")
+        logger.warning("No LinkedIn profile URL found in top results for %s", contact_name)
         return None
 
     except Exception as e:
-        logger.exception(f"SERP API error searching for {contact_name}: {e}")
+        logger.exception("SERP API error searching for %s: %s", contact_name, e)
         return None
 
 
 if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO)
     print(get_contact_linkedin_url("Nick Gannoulis", "OnQ Software"))
@@ -5,11 +5,9 @@ from pathlib import Path
 from scraper import scrape_all_companies, scrape_companies, read_companies_from_csv
 from salesforce import import_companies_from_salesforce, push_to_salesforce
 from utils.email_client import send_all_reports, send_owner_digests
+from utils.logging_setup import setup_logging
 
-logging.basicConfig(
-    level=logging.INFO,
-    format="%(asctime)s | %(levelname)s | %(name)s | %(message)s",
-)
+setup_logging()
 logger = logging.getLogger(__name__)
 
 def run(
@@ -36,15 +34,15 @@ def run(
     # ── Scrape phase ──
     if not deliver_only:
         if company:
-            logger.info(f"Single-company mode: {company}")
+            logger.info("Single-company mode: %s", company)
             import_companies_from_salesforce()
             companies = read_companies_from_csv()
-            match = [(name, loc) for name, loc in companies if name.lower() == company.lower()]
+            match = [entry for entry in companies if entry[0].lower() == company.lower()]
             if not match:
-                logger.error(f"Company '{company}' not found in companies.csv")
+                logger.error("Company '%s' not found in companies.csv", company)
                 return
-            logger.info(f"Found: {match[0][0]} in {match[0][1]}")
-            asyncio.run(scrape_companies(match, inter_delay=False))
+            logger.info("Found: %s in %s", match[0][0], match[0][1])
+            asyncio.run(scrape_companies(match))
         elif batch:
             batch_num, total_batches = _parse_batch(batch)
             if not scrape_only:
@@ -52,19 +50,19 @@ def run(
             companies = read_companies_from_csv()
             if limit:
                 companies = companies[:limit]
-                logger.info(f"Limited to first {limit} companies")
+                logger.info("Limited to first %s companies", limit)
             chunk = _get_batch_slice(companies, batch_num, total_batches)
-            logger.info(f"Batch {batch_num}/{total_batches}: processing {len(chunk)} of {len(companies)} companies")
-            for name, loc in chunk:
-                logger.info(f"  - {name}")
+            logger.info("Batch %s/%s: processing %s of %s companies", batch_num, total_batches, len(chunk), len(companies))
+            for name, _, _ in chunk:
+                logger.info("  - %s", name)
             asyncio.run(scrape_companies(chunk))
         else:
             import_companies_from_salesforce()
             companies = read_companies_from_csv()
             if limit:
                 companies = companies[:limit]
-                logger.info(f"Limited to first {limit} companies")
-            asyncio.run(scrape_companies(companies))
+                logger.info("Limited to first %s companies", limit)
+            asyncio.run(scrape_all_companies(companies))
 
     if scrape_only:
         logger.info("Scrape-only mode: skipping push, email, and cleanup")
@@ -114,7 +112,7 @@ def cleanup(input_dir: str = "data/input", output_dir: str = "data/output"):
         for file in dir_path.iterdir():
             if file.is_file():
                 file.unlink()
-                logger.info(f"Deleted {file}")
+                logger.info("Deleted %s", file)
     logger.info("Cleanup complete")
 
 
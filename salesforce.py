@@ -82,11 +82,11 @@ def get_owner_emails(token, company_names):
             if name in company_to_owner and company_to_owner[name] is None:
                 company_to_owner[name] = email
     except Exception as e:
-        logger.error(f"Batch owner query failed: {e}")
+        logger.error("Batch owner query failed: %s", e)
 
     unmapped = [n for n, e in company_to_owner.items() if e is None]
     if unmapped:
-        logger.warning(f"Could not resolve owner for: {unmapped}")
+        logger.warning("Could not resolve owner for: %s", unmapped)
 
     return company_to_owner
 
@@ -112,7 +112,7 @@ def write_owner_mapping(company_to_owner):
     with open(mapping_path, "w") as f:
         json.dump(mapping, f, indent=2)
 
-    logger.info(f"Wrote owner mapping: {len(owner_to_companies)} owners, {len(unmapped)} unmapped")
+    logger.info("Wrote owner mapping: %s owners, %s unmapped", len(owner_to_companies), len(unmapped))
 
 
 def get_primary_contacts(token, company_names):
@@ -137,11 +137,11 @@ def get_primary_contacts(token, company_names):
             if opp_name in company_to_contact and company_to_contact[opp_name] is None:
                 company_to_contact[opp_name] = contact_name
     except Exception as e:
-        logger.error(f"Batch contact query failed: {e}")
+        logger.error("Batch contact query failed: %s", e)
 
     unmapped = [n for n, c in company_to_contact.items() if c is None]
     if unmapped:
-        logger.warning(f"Could not resolve primary contact for: {unmapped}")
+        logger.warning("Could not resolve primary contact for: %s", unmapped)
 
     return company_to_contact
 
@@ -154,7 +154,7 @@ def write_contact_mapping(company_to_contact):
         json.dump(company_to_contact, f, indent=2)
 
     mapped = sum(1 for v in company_to_contact.values() if v is not None)
-    logger.info(f"Wrote contact mapping: {mapped} mapped, {len(company_to_contact) - mapped} unmapped")
+    logger.info("Wrote contact mapping: %s mapped, %s unmapped", mapped, len(company_to_contact) - mapped)
 
 
 def write_companies_csv(companies):
@@ -164,7 +164,7 @@ def write_companies_csv(companies):
         writer = csv.writer(f)
         writer.writerow(["company", "location"])
         writer.writerows(companies)
-    logger.info(f"Wrote {len(companies)} companies to {csv_path}")
+    logger.info("Wrote %s companies to %s", len(companies), csv_path)
 
 
 def sf_patch(endpoint, token, payload):
@@ -185,7 +185,7 @@ def _get_opportunity_ids(token, company_names):
         for record in result.get("records", []):
             name_to_id[record["Name"]] = record["Id"]
     except Exception as e:
-        logger.error(f"Failed to query Opportunity IDs: {e}")
+        logger.error("Failed to query Opportunity IDs: %s", e)
 
     return name_to_id
 
@@ -268,7 +268,7 @@ def _format_contact_activity_html(data):
 
         return html
     except Exception as e:
-        logger.error(f"Error formatting contact activity HTML: {e}")
+        logger.error("Error formatting contact activity HTML: %s", e)
         return '<div style="padding:8px; color:#888;"><i>Contact activity unavailable.</i></div>'
 
 
@@ -325,13 +325,13 @@ def push_to_salesforce(output_dir=None):
             if isinstance(data, dict) and "company" in data:
                 company_data[data["company"]] = data
         except Exception as e:
-            logger.error(f"Failed to load {filename}, skipping: {e}")
+            logger.error("Failed to load %s, skipping: %s", filename, e)
 
-    logger.info(f"Loaded {len(company_data)} company reports")
+    logger.info("Loaded %s company reports", len(company_data))
 
     # Get Opportunity IDs for all companies
     name_to_id = _get_opportunity_ids(token, list(company_data.keys()))
-    logger.info(f"Matched {len(name_to_id)} companies to Opportunities")
+    logger.info("Matched %s companies to Opportunities", len(name_to_id))
 
     updated = 0
     failed = 0
@@ -339,7 +339,7 @@ def push_to_salesforce(output_dir=None):
         try:
             opp_id = name_to_id.get(company_name)
             if not opp_id:
-                logger.warning(f"No Opportunity found for: {company_name}")
+                logger.warning("No Opportunity found for: %s", company_name)
                 failed += 1
                 continue
 
@@ -351,16 +351,16 @@ def push_to_salesforce(output_dir=None):
 
             resp = sf_patch(f"sobjects/Opportunity/{opp_id}", token, payload)
             if resp.status_code == 204:
-                logger.info(f"Updated: {company_name}")
+                logger.info("Updated: %s", company_name)
                 updated += 1
             else:
-                logger.error(f"Failed to update {company_name}: {resp.status_code} {resp.text}")
+                logger.error("Failed to update %s: %s %s", company_name, resp.status_code, resp.text)
                 failed += 1
         except Exception as e:
-            logger.error(f"Error processing {company_name}, skipping: {e}")
+            logger.error("Error processing %s, skipping: %s", company_name, e)
             failed += 1
 
-    logger.info(f"Push complete: {updated} updated, {failed} failed")
+    logger.info("Push complete: %s updated, %s failed", updated, failed)
 
 
 def import_companies_from_salesforce():
@@ -369,15 +369,15 @@ def import_companies_from_salesforce():
     logger.info("Authenticated successfully")
 
     dashboard_ids = get_dashboard_ids(token)
-    logger.info(f"Found {len(dashboard_ids)} dashboard(s)")
+    logger.info("Found %s dashboard(s)", len(dashboard_ids))
 
     companies = []
     for dashboard_id in dashboard_ids:
         extracted = extract_companies(token, dashboard_id)
-        logger.info(f"Dashboard {dashboard_id}: extracted {len(extracted)} companies")
+        logger.info("Dashboard %s: extracted %s companies", dashboard_id, len(extracted))
         companies.extend(extracted)
 
-    logger.info(f"Total companies extracted: {len(companies)}")
+    logger.info("Total companies extracted: %s", len(companies))
     write_companies_csv(companies)
 
     company_names = list(set(c[0] for c in companies))
@@ -388,7 +388,7 @@ def import_companies_from_salesforce():
         company_to_contact = get_primary_contacts(token, company_names)
         write_contact_mapping(company_to_contact)
     except Exception as e:
-        logger.error(f"Contact mapping failed (non-fatal, continuing): {e}")
+        logger.error("Contact mapping failed (non-fatal, continuing): %s", e)
 
     logger.info("Import complete")
 
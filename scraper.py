@@ -1,173 +1,259 @@
 import asyncio
 import csv
+import functools
+from datetime import timedelta
 import json
 import logging
+import multiprocessing
 import os
 import random
+from concurrent.futures import ProcessPoolExecutor
+import orjson
+import requests_cache
+from aiolimiter import AsyncLimiter
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 from company.get_company_info import get_info
-from scrapers.linkedin_scraper_api import scrape_news_linkedin as scrape_linkedin_api
+from scrapers.linkedin_scraper_api import scrape_news_linkedin_async as scrape_linkedin_api
 from scrapers.linkedin_scraper_requests import scrape_news_linkedin as scrape_linkedin_requests
-from scrapers.linkedin_scraper_playwright import scrape_news_linkedin as scrape_linkedin_playwright
-from utils.summarizer import summarize_posts, generate_reachout_message, generate_potential_actions, add_posts_to_news_file, summarize_contact_posts
+from scrapers.linkedin_scraper_playwright import scrape_news_linkedin as scrape_linkedin_playwright, LinkedInSession
+from utils.summarizer import summarize_posts_data, generate_outreach, add_posts_to_news_data, summarize_contact_posts, count_openai_requests
 from scrapers.perplexity_scraper import scrape_news_perplexity
 from company.serp_contact_url import get_contact_linkedin_url
-from scrapers.linkedin_contact_scraper import scrape_contact_linkedin
+from scrapers.linkedin_contact_scraper import scrape_contact_linkedin_async as scrape_contact_linkedin
+from utils.file_io import atomic_open
+from utils.logging_setup import setup_logging
 
-logging.basicConfig(
-    level=logging.INFO,  # change to DEBUG for more verbosity
-    format="%(asctime)s | %(levelname)s | %(name)s | %(message)s",
-)
+setup_logging()  # pass logging.DEBUG for more verbosity
 logger = logging.getLogger(__name__)
 
+# Use uvloop's faster event loop for every asyncio.run() (main.py, worker shards)
+# when it is installed; not available on Windows, so it stays optional.
+try:
+    import uvloop
+    asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+except ImportError:
+    pass
+
+# Shared HTTP session: pooled keep-alive connections (no TLS handshake per request)
+# plus retries on throttling / transient server errors. POSTs are not retried.
+# SERP and Firmable GETs are cached on disk for 7 days, so re-running the same
+# company list doesn't spend search quota again; BrightData polling and LinkedIn
+# pages are never cached.
+HTTP_CACHE_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "data", "cache", "http")
+os.makedirs(os.path.dirname(HTTP_CACHE_PATH), exist_ok=True)
+SESSION = requests_cache.CachedSession(
+    HTTP_CACHE_PATH,
+    backend="sqlite",
+    wal=True,
+    expire_after=timedelta(days=7),
+    allowable_methods=("GET",),
+    allowable_codes=(200,),
+    urls_expire_after={
+        "api.brightdata.com": requests_cache.DO_NOT_CACHE,
+        "*.linkedin.com": requests_cache.DO_NOT_CACHE,
+        "*": timedelta(days=7),
+    },
+)
+SESSION.mount("https://", HTTPAdapter(
+    pool_connections=32,
+    pool_maxsize=32,
+    max_retries=Retry(total=3, backoff_factor=0.5, status_forcelist=[429, 500, 502, 503, 504]),
+))
+
+_LINKEDIN_URL_TMPL = "https://www.linkedin.com/company/{}/posts/"
+
+# Token-bucket rate limits (requests per minute) shared by every company in flight.
+# Each worker process gets its own buckets; _init_shard_worker slows them down so
+# SCRAPE_WORKERS processes together stay within these totals.
+LINKEDIN_LIMITER = AsyncLimiter(6, 60)
+PERPLEXITY_LIMITER = AsyncLimiter(10, 60)
+# Counted per OpenAI request: one per post-analysis chunk + reachout message + actions
+OPENAI_LIMITER = AsyncLimiter(30, 60)
+
+
+class Backoff:
+    """
+    Process-wide adaptive delay before starting each company. Stays at 0s on
+    healthy runs; doubles (30s -> 600s max) whenever an upstream returns 429
+    and halves again on each successful response.
+    """
+    delay = 0.0
+    MIN_DELAY = 30.0
+    MAX_DELAY = 600.0
+
+    @classmethod
+    def bump(cls):
+        cls.delay = min(cls.delay * 2 or cls.MIN_DELAY, cls.MAX_DELAY)
+        logger.warning("Rate limited upstream, backing off %.0fs between companies", cls.delay)
+
+    @classmethod
+    def decay(cls):
+        if cls.delay:
+            cls.delay = cls.delay * 0.5 if cls.delay * 0.5 >= 1 else 0.0
+
+
+def _track_rate_limit(response, *args, **kwargs):
+    """Session response hook: feed 429s and successes into Backoff."""
+    if response.status_code == 429:
+        Backoff.bump()
+    elif response.ok:
+        Backoff.decay()
+
+
+SESSION.hooks['response'].append(_track_rate_limit)
+
+
+def _write_json(f, data):
+    """
+    Serialize `data` with orjson and write it to binary file `f` in a single write() call.
+    Output is compact unless DEBUG logging is enabled, in which case it is indented.
+    """
+    if logger.isEnabledFor(logging.DEBUG):
+        f.write(orjson.dumps(data, option=orjson.OPT_INDENT_2))
+    else:
+        f.write(orjson.dumps(data))
+
+
+@functools.lru_cache(maxsize=4)
+def _load_mapping_cached(mapping_path, mtime):
+    """Parse a mapping JSON file. Cached on (path, mtime) so edits are picked up."""
+    with open(mapping_path, 'r', encoding='utf-8') as f:
+        return json.loads(f.read())
+
 
 def load_contact_mapping():
-    """Load the company -> contact_name mapping from JSON."""
+    """Load the company -> contact_name mapping from JSON (cached until the file changes)."""
     mapping_path = os.path.join(os.path.dirname(os.path.abspath(__file__)), "data", "input", "contact_mapping.json")
     if not os.path.exists(mapping_path):
         logger.warning("Contact mapping not found")
         return {}
     try:
-        with open(mapping_path, 'r', encoding='utf-8') as f:
-            return json.load(f)
+        return _load_mapping_cached(mapping_path, os.stat(mapping_path).st_mtime)
     except Exception as e:
-        logger.error(f"Failed to load contact mapping: {e}")
+        logger.error("Failed to load contact mapping: %s", e)
         return {}
 
 
-def _add_contact_data_to_output(news_filepath, contact_name, contact_summaries):
-    """Add contact name and contact post summaries to the company output JSON."""
+def _load_output(news_filepath):
+    """Read the company output JSON into a dict. Returns None if it can't be read."""
+    if not news_filepath or not os.path.exists(news_filepath):
+        return None
     try:
-        with open(news_filepath, 'r', encoding='utf-8') as f:
-            data = json.load(f)
-
-        data['contact_name'] = contact_name
-        data['contact_posts'] = contact_summaries if contact_summaries else []
-
-        with open(news_filepath, 'w', encoding='utf-8') as f:
-            json.dump(data, f, indent=2)
-
-        post_count = len(data['contact_posts'])
-        logger.info(f"Added contact data to {news_filepath}: {contact_name}, {post_count} posts")
+        with open(news_filepath, 'rb') as f:
+            return orjson.loads(f.read())
     except Exception as e:
-        logger.warning(f"Could not add contact data to {news_filepath}: {e}")
+        logger.warning("Could not read %s: %s", news_filepath, e)
+        return None
 
 
-def ensure_posts_field(news_filepath):
+def _save_output(news_filepath, data):
     """
-    Ensure the JSON file has a 'posts' field, adding an empty array if missing.
+    Write the company output dict back to disk atomically (see atomic_open),
+    so a crash mid-write never leaves a truncated JSON. Returns True on success.
     """
-    if not news_filepath or not os.path.exists(news_filepath):
-        return False
-
     try:
-        with open(news_filepath, 'r', encoding='utf-8') as f:
-            data = json.load(f)
-
-        if 'posts' not in data:
-            data['posts'] = []
-            with open(news_filepath, 'w', encoding='utf-8') as f:
-                json.dump(data, f, indent=2)
-            logger.info(f"Added empty posts array to {news_filepath}")
-
+        with atomic_open(news_filepath, 'wb') as f:
+            _write_json(f, data)
         return True
     except Exception as e:
-        logger.warning(f"Could not ensure posts field in {news_filepath}: {e}")
+        logger.warning("Could not write %s: %s", news_filepath, e)
         return False
 
 
-def add_linkedin_url(news_filepath, company_info):
-    """
-    Add linkedin_url field to the JSON file.
-    """
-    if not news_filepath or not os.path.exists(news_filepath):
-        return False
+def _set_contact_data(data, contact_name, contact_summaries):
+    """Set contact name and contact post summaries on the output dict."""
+    data['contact_name'] = contact_name
+    data['contact_posts'] = contact_summaries if contact_summaries else []
 
-    try:
-        with open(news_filepath, 'r', encoding='utf-8') as f:
-            data = json.load(f)
 
-        linkedin_id = company_info.get('linkedin') if company_info else None
-        if linkedin_id:
-            data['linkedin_url'] = f"https://www.linkedin.com/company/{linkedin_id}/posts/"
-        else:
-            data['linkedin_url'] = None
+def _set_posts_field(data):
+    """Ensure the output dict has a 'posts' field. Returns True if it was added."""
+    if 'posts' in data:
+        return False
+    data['posts'] = []
+    return True
 
-        with open(news_filepath, 'w', encoding='utf-8') as f:
-            json.dump(data, f, indent=2)
 
-        logger.info(f"Added linkedin_url to {news_filepath}")
-        return True
-    except Exception as e:
-        logger.warning(f"Could not add linkedin_url to {news_filepath}: {e}")
-        return False
+def _set_linkedin_url(data, company_info):
+    """Set linkedin_url on the output dict from the company's LinkedIn ID."""
+    linkedin_id = company_info.get('linkedin') if company_info else None
+    data['linkedin_url'] = _LINKEDIN_URL_TMPL.format(linkedin_id) if linkedin_id else None
+
 
-async def scrape(company, location):
+def _finalize_data(data, company_info, contact_name, contact_summaries):
     """
-    Scrape news and LinkedIn posts for a single company.
+    Finalize the company output dict: ensure the 'posts' field exists,
+    set linkedin_url, and attach the contact name and post summaries.
+    """
+    _set_posts_field(data)
+    _set_linkedin_url(data, company_info)
+    _set_contact_data(data, contact_name, contact_summaries)
 
-    This function handles failures gracefully - if one step fails,
-    it will continue with subsequent steps where possible.
 
-    Returns:
-        dict: Results summary with success/failure status for each step
-    """
-    results = {
-        'company': company,
-        'location': location,
-        'company_info': False,
-        'news_scrape': False,
-        'linkedin_scrape': False,
-        'contact_scrape': False,
-        'summarization': False,
-        'errors': []
-    }
+async def _save_finalized(news_filepath, news_data, contact_name):
+    """Write the already finalized output dict (off the event loop). Returns False if the write failed."""
+    if news_data is None:
+        return True
+    if not await asyncio.to_thread(_save_output, news_filepath, news_data):
+        return False
+    logger.info("Finalized %s: contact=%s, %s contact posts", news_filepath, contact_name, len(news_data['contact_posts']))
+    return True
 
-    # Step 1: Get company info
-    logger.info(f"Starting scrape for {company} in {location}")
+
+async def _safe_remove(filepath, label):
+    """Delete an intermediate file off the event loop; a missing file is not an error."""
+    if not filepath:
+        return
     try:
-        company_info = get_info(company, location)
+        await asyncio.to_thread(os.remove, filepath)
+        logger.info("Deleted %s: %s", label, filepath)
+    except FileNotFoundError:
+        pass
     except Exception as e:
-        logger.exception(f"Unexpected error getting company info for {company}: {e}")
-        company_info = None
-        results['errors'].append(f"Company info: {e}")
+        logger.warning("Error deleting %s: %s", filepath, e)
 
-    if not company_info:
-        logger.error(f"Could not retrieve company info for {company}, skipping this company")
-        return results
-
-    results['company_info'] = True
-    logger.debug("Retrieved company info: %s", company_info)
 
-    # Step 2: Scrape news from Perplexity
+async def _scrape_news(company, company_info, results):
+    """Step 2: Scrape news from Perplexity. Returns the news JSON path or None."""
     news_filepath = None
     try:
-        news_filepath = await scrape_news_perplexity(company_info, "month")
+        async with PERPLEXITY_LIMITER:
+            news_filepath = await scrape_news_perplexity(company_info, "month")
         if news_filepath:
             results['news_scrape'] = True
-            logger.info(f"News scrape successful for {company}")
+            logger.info("News scrape successful for %s", company)
         else:
-            logger.warning(f"News scrape returned no results for {company}")
+            logger.warning("News scrape returned no results for %s", company)
             results['errors'].append("News scrape returned None")
     except Exception as e:
-        logger.exception(f"Unexpected error in news scrape for {company}: {e}")
+        logger.exception("Unexpected error in news scrape for %s: %s", company, e)
         results['errors'].append(f"News scrape: {e}")
+    return news_filepath
+
 
-    # Step 3: Scrape LinkedIn posts (try API -> Requests -> Playwright)
+async def _scrape_linkedin_with_fallbacks(company, company_info, results, browser_session=None):
+    """
+    Step 3: Scrape LinkedIn posts (try API -> Requests -> Playwright).
+    The Playwright fallback reuses `browser_session` (a LinkedInSession) when given.
+    Returns the posts file path or None.
+    """
     posts_filepath = None
     scraper_used = None
 
     # Try API scraper first
     try:
-        logger.info(f"Attempting LinkedIn scrape via API for {company}")
-        posts_filepath = scrape_linkedin_api(company_info)
+        logger.info("Attempting LinkedIn scrape via API for %s", company)
+        async with LINKEDIN_LIMITER:
+            posts_filepath = await scrape_linkedin_api(company_info, session=SESSION)
         if posts_filepath:
             results['linkedin_scrape'] = True
             scraper_used = 'API'
-            logger.info(f"LinkedIn API scrape successful for {company}")
+            logger.info("LinkedIn API scrape successful for %s", company)
         else:
-            logger.warning(f"LinkedIn API scrape returned no results for {company}")
+            logger.warning("LinkedIn API scrape returned no results for %s", company)
     except Exception as e:
-        logger.warning(f"LinkedIn API scrape failed for {company}: {e}")
+        logger.warning("LinkedIn API scrape failed for %s: %s", company, e)
         results['errors'].append(f"LinkedIn API scrape: {e}")
 
     # Fall back to requests-based scraper if API failed (only if explicitly enabled)
@@ -175,263 +261,453 @@ async def scrape(company, location):
 
     if not posts_filepath and use_requests_fallback:
         try:
-            logger.info(f"Falling back to requests-based scraper for {company}")
-            posts_filepath = scrape_linkedin_requests(company_info)
+            logger.info("Falling back to requests-based scraper for %s", company)
+            # Own per-call session: guest cookies must not be shared across companies,
+            # and SESSION's automatic 429 retries would re-hit LinkedIn straight away
+            async with LINKEDIN_LIMITER:
+                posts_filepath = await asyncio.to_thread(scrape_linkedin_requests, company_info)
             if posts_filepath:
                 results['linkedin_scrape'] = True
                 scraper_used = 'Requests'
-                logger.info(f"LinkedIn requests scrape successful for {company}")
+                logger.info("LinkedIn requests scrape successful for %s", company)
             else:
-                logger.warning(f"LinkedIn requests scrape returned no results for {company}")
+                logger.warning("LinkedIn requests scrape returned no results for %s", company)
         except Exception as e:
-            logger.warning(f"LinkedIn requests scrape failed for {company}: {e}")
+            logger.warning("LinkedIn requests scrape failed for %s: %s", company, e)
             results['errors'].append(f"LinkedIn requests scrape: {e}")
     elif not posts_filepath and not use_requests_fallback:
-        logger.info(f"Requests fallback disabled. Set USE_REQUESTS_FALLBACK=true to enable.")
+        logger.info("Requests fallback disabled. Set USE_REQUESTS_FALLBACK=true to enable.")
 
     # Fall back to Playwright if both API and Requests failed (only if explicitly enabled)
     use_playwright_fallback = os.getenv('USE_PLAYWRIGHT_FALLBACK', 'false').lower() == 'true'
 
     if not posts_filepath and use_playwright_fallback:
         try:
-            logger.info(f"Falling back to Playwright scraper for {company}")
-            posts_filepath = await scrape_linkedin_playwright(company_info)
+            logger.info("Falling back to Playwright scraper for %s", company)
+            async with LINKEDIN_LIMITER:
+                if browser_session is not None:
+                    posts_filepath = await browser_session.scrape_company(company_info)
+                else:
+                    posts_filepath = await scrape_linkedin_playwright(company_info)
             if posts_filepath:
                 results['linkedin_scrape'] = True
                 scraper_used = 'Playwright'
-                logger.info(f"LinkedIn Playwright scrape successful for {company}")
+                logger.info("LinkedIn Playwright scrape successful for %s", company)
             else:
-                logger.warning(f"LinkedIn Playwright scrape returned no results for {company}")
+                logger.warning("LinkedIn Playwright scrape returned no results for %s", company)
                 results['errors'].append("All scrapers returned None")
         except Exception as e:
-            logger.exception(f"Unexpected error in LinkedIn Playwright scrape for {company}: {e}")
+            logger.exception("Unexpected error in LinkedIn Playwright scrape for %s: %s", company, e)
             results['errors'].append(f"LinkedIn Playwright scrape: {e}")
     elif not posts_filepath and not use_playwright_fallback:
-        logger.info(f"Playwright fallback disabled. Set USE_PLAYWRIGHT_FALLBACK=true to enable.")
+        logger.info("Playwright fallback disabled. Set USE_PLAYWRIGHT_FALLBACK=true to enable.")
         if not scraper_used:
             results['errors'].append("All enabled LinkedIn scrapers failed")
 
     if scraper_used:
-        logger.info(f"LinkedIn scrape completed using: {scraper_used}")
-
-    # Step 3.5: Scrape contact's LinkedIn posts
-    contact_posts_filepath = None
-    contact_summaries = None
-    contact_name = None
+        logger.info("LinkedIn scrape completed using: %s", scraper_used)
 
-    try:
-        contact_mapping = load_contact_mapping()
-        contact_name = contact_mapping.get(company)
+    return posts_filepath
 
-        if contact_name:
-            logger.info(f"Found primary contact for {company}: {contact_name}")
 
-            contact_linkedin_url = get_contact_linkedin_url(contact_name, company)
+async def _scrape_contact(company, contact_name, results):
+    """
+    Step 3.5: Scrape the primary contact's LinkedIn posts.
+    Returns (contact_posts_filepath, contact_summaries, contact_name).
+    """
+    contact_posts_filepath = None
+    contact_summaries = None
 
-            if contact_linkedin_url:
-                contact_posts_filepath = scrape_contact_linkedin(contact_name, contact_linkedin_url, company)
+    if not contact_name:
+        logger.info("No primary contact mapped for %s", company)
+        return contact_posts_filepath, contact_summaries, contact_name
 
-                if contact_posts_filepath:
-                    contact_summaries = summarize_contact_posts(contact_posts_filepath, contact_name)
-                    if contact_summaries is not None:
-                        results['contact_scrape'] = True
-                        logger.info(f"Contact scrape successful for {contact_name} ({company}): {len(contact_summaries)} posts")
-                    else:
-                        logger.warning(f"Contact post summarization returned None for {contact_name}")
+    try:
+        logger.info("Found primary contact for %s: %s", company, contact_name)
+
+        contact_linkedin_url = await asyncio.to_thread(get_contact_linkedin_url, contact_name, company, session=SESSION)
+
+        if contact_linkedin_url:
+            async with LINKEDIN_LIMITER:
+                contact_posts_filepath = await scrape_contact_linkedin(
+                    contact_name, contact_linkedin_url, company, session=SESSION
+                )
+
+            if contact_posts_filepath:
+                async with OPENAI_LIMITER:
+                    contact_summaries = await asyncio.to_thread(summarize_contact_posts, contact_posts_filepath, contact_name)
+                if contact_summaries is not None:
+                    results['contact_scrape'] = True
+                    logger.info("Contact scrape successful for %s (%s): %s posts", contact_name, company, len(contact_summaries))
                 else:
-                    logger.warning(f"No LinkedIn posts found for contact {contact_name}")
+                    logger.warning("Contact post summarization returned None for %s", contact_name)
             else:
-                logger.warning(f"Could not find LinkedIn URL for contact {contact_name}")
+                logger.warning("No LinkedIn posts found for contact %s", contact_name)
         else:
-            logger.info(f"No primary contact mapped for {company}")
+            logger.warning("Could not find LinkedIn URL for contact %s", contact_name)
     except Exception as e:
-        logger.warning(f"Contact scrape failed for {company}: {e}")
+        logger.warning("Contact scrape failed for %s: %s", company, e)
         results['errors'].append(f"Contact scrape: {e}")
 
+    return contact_posts_filepath, contact_summaries, contact_name
+
+
+async def scrape(company, location, contact_name=None, browser_session=None):
+    """
+    Scrape news and LinkedIn posts for a single company.
+
+    This function handles failures gracefully - if one step fails,
+    it will continue with subsequent steps where possible.
+
+    Args:
+        company: Company name
+        location: Company city
+        contact_name: Primary contact to scrape (from read_companies_from_csv); None skips Step 3.5
+        browser_session: Optional shared LinkedInSession for the Playwright fallback
+
+    Returns:
+        dict: Results summary with success/failure status for each step
+    """
+    results = {
+        'company': company,
+        'location': location,
+        'company_info': False,
+        'news_scrape': False,
+        'linkedin_scrape': False,
+        'contact_scrape': False,
+        'summarization': False,
+        'errors': []
+    }
+
+    # Step 1: Get company info
+    logger.info("Starting scrape for %s in %s", company, location)
+    try:
+        company_info = await asyncio.to_thread(get_info, company, location, session=SESSION)
+    except Exception as e:
+        logger.exception("Unexpected error getting company info for %s: %s", company, e)
+        company_info = None
+        results['errors'].append(f"Company info: {e}")
+
+    if not company_info:
+        logger.error("Could not retrieve company info for %s, skipping this company", company)
+        return results
+
+    results['company_info'] = True
+    logger.debug("Retrieved company info: %s", company_info)
+
+    # Steps 2, 3 and 3.5 are independent of each other, so run them concurrently
+    news_outcome, posts_outcome, contact_outcome = await asyncio.gather(
+        _scrape_news(company, company_info, results),
+        _scrape_linkedin_with_fallbacks(company, company_info, results, browser_session),
+        _scrape_contact(company, contact_name, results),
+        return_exceptions=True,
+    )
+
+    news_filepath = None
+    if isinstance(news_outcome, BaseException):
+        logger.error("News scrape crashed for %s: %s", company, news_outcome)
+        results['errors'].append(f"News scrape: {news_outcome}")
+    else:
+        news_filepath = news_outcome
+
+    posts_filepath = None
+    if isinstance(posts_outcome, BaseException):
+        logger.error("LinkedIn scrape crashed for %s: %s", company, posts_outcome)
+        results['errors'].append(f"LinkedIn scrape: {posts_outcome}")
+    else:
+        posts_filepath = posts_outcome
+
+    contact_posts_filepath, contact_summaries, contact_name = None, None, None
+    if isinstance(contact_outcome, BaseException):
+        logger.error("Contact scrape crashed for %s: %s", company, contact_outcome)
+        results['errors'].append(f"Contact scrape: {contact_outcome}")
+    else:
+        contact_posts_filepath, contact_summaries, contact_name = contact_outcome
+
+    # Load the company output once; every later step mutates this dict and it is written once at the end
+    news_data = await asyncio.to_thread(_load_output, news_filepath)
+    if news_filepath and news_data is None:
+        results['errors'].append(f"Could not read news file {news_filepath}")
+
     # Step 4: Summarize and merge data (only if we have both files)
-    if news_filepath and posts_filepath:
+    if news_data is not None and posts_filepath:
         try:
-            summary_result = summarize_posts(news_filepath, posts_filepath)
+            openai_requests = await asyncio.to_thread(count_openai_requests, posts_filepath)
+            # A single acquire cannot exceed the bucket size, so reserve large counts in bucket-sized parts
+            while openai_requests > 0:
+                amount = min(openai_requests, OPENAI_LIMITER.max_rate)
+                await OPENAI_LIMITER.acquire(amount)
+                openai_requests -= amount
+            summary_result = await asyncio.to_thread(summarize_posts_data, news_data, posts_filepath)
             if summary_result is not None:
                 results['summarization'] = True
-                logger.info(f"Summarization successful for {company}")
+                logger.info("Summarization successful for %s", company)
             else:
-                logger.warning(f"Summarization returned no results for {company}")
+                logger.warning("Summarization returned no results for %s", company)
                 results['errors'].append("Summarization returned None")
         except Exception as e:
-            logger.exception(f"Unexpected error in summarization for {company}: {e}")
+            logger.exception("Unexpected error in summarization for %s: %s", company, e)
             results['errors'].append(f"Summarization: {e}")
-    elif news_filepath:
+    elif news_data is not None:
         # No LinkedIn posts, but still generate reachout message and actions from news alone
-        logger.info(f"No LinkedIn posts for {company} - generating actions from news only")
+        logger.info("No LinkedIn posts for %s - generating actions from news only", company)
         try:
-            with open(news_filepath, 'r', encoding='utf-8') as f:
-                company_data = json.load(f)
-            company_name = company_data.get('company', company)
+            company_name = news_data.get('company', company)
 
-            message = generate_reachout_message(company_name, [], company_data)
-            potential_actions = generate_potential_actions(company_name, [], company_data)
-            add_posts_to_news_file(news_filepath, [], message, potential_actions)
+            await OPENAI_LIMITER.acquire(2)
+            message, potential_actions = await asyncio.to_thread(generate_outreach, company_name, [], news_data)
+            add_posts_to_news_data(news_data, [], message, potential_actions)
             results['summarization'] = True
         except Exception as e:
-            logger.warning(f"Failed to generate actions from news for {company}: {e}")
+            logger.warning("Failed to generate actions from news for %s: %s", company, e)
             results['errors'].append(f"News-only actions: {e}")
     else:
-        logger.info(f"Skipping summarization for {company} - no news data available")
-
-    # Step 5: Ensure posts field exists in JSON (even if empty) and add linkedin_url
-    if news_filepath:
-        ensure_posts_field(news_filepath)
-        add_linkedin_url(news_filepath, company_info)
-        _add_contact_data_to_output(news_filepath, contact_name, contact_summaries)
-
-    # Cleanup: Delete LinkedIn posts file after summarization
-    try:
-        if posts_filepath and os.path.exists(posts_filepath):
-            os.remove(posts_filepath)
-            logger.info(f"Deleted posts file: {posts_filepath}")
-    except Exception as e:
-        logger.warning(f"Error deleting {posts_filepath}: {e}")
+        logger.info("Skipping summarization for %s - no news data available", company)
 
+    # Step 5: Ensure posts field exists, add linkedin_url and contact data, then write once.
+    # Finalizing happens first so a failure there leaves the intermediate posts files on disk;
+    # after that they are deleted concurrently with the write.
     try:
-        if contact_posts_filepath and os.path.exists(contact_posts_filepath):
-            os.remove(contact_posts_filepath)
-            logger.info(f"Deleted contact posts file: {contact_posts_filepath}")
+        if news_data is not None:
+            _finalize_data(news_data, company_info, contact_name, contact_summaries)
     except Exception as e:
-        logger.warning(f"Error deleting {contact_posts_filepath}: {e}")
+        logger.exception("Could not finalize output for %s: %s", company, e)
+        results['errors'].append(f"Finalize output: {e}")
+    else:
+        save_outcome, *remove_outcomes = await asyncio.gather(
+            _save_finalized(news_filepath, news_data, contact_name),
+            _safe_remove(posts_filepath, "posts file"),
+            _safe_remove(contact_posts_filepath, "contact posts file"),
+            return_exceptions=True,
+        )
+        if isinstance(save_outcome, BaseException):
+            logger.error("Could not write output for %s: %s", company, save_outcome, exc_info=save_outcome)
+            results['errors'].append(f"Write output: {save_outcome}")
+        elif not save_outcome:
+            results['errors'].append(f"Could not write {news_filepath}")
+        for outcome in remove_outcomes:
+            if isinstance(outcome, BaseException):
+                logger.warning("Cleanup failed for %s: %s", company, outcome)
+                results['errors'].append(f"Cleanup: {outcome}")
 
     # Log summary for this company
     success_count = sum([results['company_info'], results['news_scrape'],
                          results['linkedin_scrape'], results['contact_scrape'], results['summarization']])
-    logger.info(f"Completed scrape for {company}: {success_count}/5 steps successful")
+    logger.info("Completed scrape for %s: %s/5 steps successful", company, success_count)
 
     return results
 
 
 def read_companies_from_csv(csv_path="data/input/companies.csv"):
     """
-    Reads companies from a CSV file and returns a list of tuples.
+    Reads companies from a CSV file and returns a list of tuples, each with the
+    company's primary contact (from contact_mapping.json) attached up front.
 
     Args:
         csv_path: Path to the CSV file (relative to project root)
 
     Returns:
-        List of tuples in format [(company_name, location), ...]
+        List of tuples in format [(company_name, location, contact_name or None), ...]
     """
     # Get absolute path to ensure it works from anywhere
     script_dir = os.path.dirname(os.path.abspath(__file__))
     full_path = os.path.join(script_dir, csv_path)
 
     companies = []
+    contact_mapping = load_contact_mapping()
 
     try:
-        with open(full_path, 'r', encoding='utf-8') as f:
-            reader = csv.DictReader(f)
-            for row in reader:
-                company = row.get('company', '').strip()
-                location = row.get('location', '').strip()
-                if company and location:
-                    companies.append((company, location))
-
-        logger.info(f"Loaded {len(companies)} companies from {csv_path}")
+        with open(full_path, 'r', encoding='utf-8', newline='') as f:
+            reader = csv.reader(f)
+            header = next(reader, [])
+            ci, li = header.index('company'), header.index('location')
+            width = max(ci, li) + 1
+            rows = ((row[ci].strip(), row[li].strip()) for row in reader if len(row) >= width)
+            companies = [
+                (company, location, contact_mapping.get(company))
+                for company, location in rows
+                if company and location
+            ]
+
+        logger.info("Loaded %s companies from %s", len(companies), csv_path)
         return companies
 
     except FileNotFoundError:
-        logger.error(f"CSV file not found at {full_path}")
+        logger.error("CSV file not found at %s", full_path)
         raise
     except Exception as e:
-        logger.error(f"Error reading CSV file: {e}")
+        logger.error("Error reading CSV file: %s", e)
         raise
 
-async def scrape_companies(companies_list, inter_delay=True):
+async def _scrape_concurrently(companies_list):
     """
-    Scrape a specific subset of companies with random 5-15 min delays between them.
+    Scrape companies concurrently, at most SCRAPE_CONCURRENCY at a time.
 
-    Args:
-        companies_list: List of (company_name, location) tuples to scrape
-        inter_delay: Whether to add random delays between companies
+    Outbound LinkedIn/Perplexity calls are paced by the shared rate limiters.
+    Each worker additionally waits Backoff.delay (0s unless upstreams have been
+    returning 429) plus a small 0-5s jitter before starting; both waits happen
+    outside the semaphore, so slots only bound active scrapes. Playwright
+    fallbacks share one browser for the whole run (launched only if needed).
 
     Returns:
-        list: Results for each company
+        list: Results for each company, in input order
     """
+    concurrency = int(os.getenv('SCRAPE_CONCURRENCY', '4'))
+    sem = asyncio.Semaphore(concurrency)
+    total = len(companies_list)
+    logger.info("Scraping %s companies with concurrency %s", total, concurrency)
+
+    async def _worker(idx, company, location, contact_name):
+        await asyncio.sleep(random.uniform(0, 5))
+        backed_off = False
+        while True:
+            async with sem:
+                delay = 0 if backed_off else Backoff.delay
+                if not delay:
+                    logger.info("=" * 50)
+                    logger.info("Processing company %s/%s: %s", idx + 1, total, company)
+                    logger.info("=" * 50)
+                    return await scrape(company, location, contact_name, browser_session)
+            # A 429 backoff is in force: hand the slot back while waiting it out (once)
+            await asyncio.sleep(delay)
+            backed_off = True
+
+    async with LinkedInSession() as browser_session:
+        outcomes = await asyncio.gather(
+            *(_worker(idx, *entry) for idx, entry in enumerate(companies_list)),
+            return_exceptions=True,
+        )
+
     all_results = []
+    for (company, location, _), outcome in zip(companies_list, outcomes):
+        if isinstance(outcome, BaseException):
+            logger.error("Critical error processing %s: %s", company, outcome, exc_info=outcome)
+            all_results.append(_failed_result(company, location, outcome))
+        else:
+            all_results.append(outcome)
 
-    for idx, (company, location) in enumerate(companies_list):
-        logger.info(f"{'=' * 50}")
-        logger.info(f"Processing company {idx + 1}/{len(companies_list)}: {company}")
-        logger.info(f"{'=' * 50}")
+    return all_results
 
-        try:
-            result = await scrape(company, location)
-            all_results.append(result)
-        except Exception as e:
-            logger.exception(f"Critical error processing {company}: {e}")
-            all_results.append({
-                'company': company,
-                'location': location,
-                'company_info': False,
-                'news_scrape': False,
-                'linkedin_scrape': False,
-                'contact_scrape': False,
-                'summarization': False,
-                'errors': [f"Critical error: {e}"]
-            })
-
-        # Inter-company delay (skip after last company)
-        if inter_delay and idx < len(companies_list) - 1:
-            delay = 120
-            logger.info(f"Waiting {delay // 60}m {delay % 60}s before next company...")
-            await asyncio.sleep(delay)
+
+async def scrape_companies(companies_list):
+    """
+    Scrape a specific subset of companies concurrently.
+
+    Args:
+        companies_list: List of (company_name, location, contact_name) tuples to scrape
+
+    Returns:
+        list: Results for each company
+    """
+    all_results = await _scrape_concurrently(companies_list)
 
     # Log summary
     logger.info("=" * 50)
     logger.info("SESSION SUMMARY")
     logger.info("=" * 50)
     successful = sum(1 for r in all_results if r['news_scrape'] or r['linkedin_scrape'])
-    logger.info(f"Companies processed: {len(all_results)}, Successful: {successful}")
+    logger.info("Companies processed: %s, Successful: %s", len(all_results), successful)
 
     return all_results
 
 
-async def scrape_all_companies():
+def _failed_result(company, location, error):
+    """Build the results dict for a company whose scrape crashed outright."""
+    return {
+        'company': company,
+        'location': location,
+        'company_info': False,
+        'news_scrape': False,
+        'linkedin_scrape': False,
+        'contact_scrape': False,
+        'summarization': False,
+        'errors': [f"Critical error: {error}"]
+    }
+
+
+def _init_shard_worker(workers):
     """
-    Scrape all companies in the list, continuing even if individual companies fail.
+    Worker process initializer: stretch each limiter's period by the worker count,
+    so the shards together keep the single-process request rates.
+    """
+    global LINKEDIN_LIMITER, PERPLEXITY_LIMITER, OPENAI_LIMITER
+    LINKEDIN_LIMITER, PERPLEXITY_LIMITER, OPENAI_LIMITER = (
+        AsyncLimiter(limiter.max_rate, limiter.time_period * workers)
+        for limiter in (LINKEDIN_LIMITER, PERPLEXITY_LIMITER, OPENAI_LIMITER)
+    )
+
+
+def _run_shard(shard):
+    """
+    Worker process entry point: scrape one shard of companies in its own event loop.
+    Must stay a module-level function so ProcessPoolExecutor can pickle it.
+    """
+    return asyncio.run(scrape_companies(shard))
+
+
+async def scrape_companies_sharded(companies_list, workers):
+    """
+    Split the company list into `workers` interleaved shards and scrape each shard
+    in a separate process. A crash in one shard (e.g. a dead browser) does not
+    take down the others.
+
+    Workers are spawned rather than forked, so each builds its own HTTP session,
+    cache connections and API clients instead of inheriting the parent's.
 
     Args:
-        companies_list: List of (company_name, location) tuples
+        companies_list: List of (company_name, location, contact_name) tuples to scrape
+        workers: Number of worker processes
 
     Returns:
         list: Results for each company
     """
+    shards = [companies_list[i::workers] for i in range(workers)]
+    logger.info("Sharding %s companies across %s worker processes", len(companies_list), workers)
+
+    loop = asyncio.get_running_loop()
+    with ProcessPoolExecutor(
+        max_workers=workers,
+        mp_context=multiprocessing.get_context("spawn"),
+        initializer=_init_shard_worker,
+        initargs=(workers,),
+    ) as executor:
+        shard_results = await asyncio.gather(
+            *(loop.run_in_executor(executor, _run_shard, shard) for shard in shards),
+            return_exceptions=True,
+        )
+
     all_results = []
-    companies_list = read_companies_from_csv()
+    for shard, shard_result in zip(shards, shard_results):
+        if isinstance(shard_result, BaseException):
+            logger.error("Worker shard failed (%s companies): %s", len(shard), shard_result)
+            all_results.extend(_failed_result(company, location, shard_result) for company, location, _ in shard)
+        else:
+            all_results.extend(shard_result)
 
-    for idx, (company, location) in enumerate(companies_list):
-        logger.info(f"=" * 50)
-        logger.info(f"Processing company {idx + 1}/{len(companies_list)}: {company}")
-        logger.info(f"=" * 50)
+    return all_results
 
-        try:
-            result = await scrape(company, location)
-            all_results.append(result)
-        except Exception as e:
-            logger.exception(f"Critical error processing {company}, moving to next company: {e}")
-            all_results.append({
-                'company': company,
-                'location': location,
-                'company_info': False,
-                'news_scrape': False,
-                'linkedin_scrape': False,
-                'contact_scrape': False,
-                'summarization': False,
-                'errors': [f"Critical error: {e}"]
-            })
-
-        # Inter-company delay to avoid API rate limits (skip after last company)
-        if idx < len(companies_list) - 1:
-            delay = 120 # delay by 2 minutes between each scrape
-            logger.info(f"Waiting {delay}s before next company to avoid rate limits...")
-            await asyncio.sleep(delay)
+
+async def scrape_all_companies(companies_list=None):
+    """
+    Scrape all companies in the list, continuing even if individual companies fail.
+    With SCRAPE_WORKERS > 1 the list is sharded across worker processes.
+
+    Args:
+        companies_list: Optional list of (company_name, location, contact_name) tuples;
+            defaults to every company in the input CSV
+
+    Returns:
+        list: Results for each company
+    """
+    if companies_list is None:
+        companies_list = read_companies_from_csv()
+
+    # Optionally shard the list across worker processes (SCRAPE_WORKERS > 1)
+    workers = min(int(os.getenv('SCRAPE_WORKERS', '1')), os.cpu_count() or 1, len(companies_list))
+    if workers > 1:
+        all_results = await scrape_companies_sharded(companies_list, workers)
+    else:
+        all_results = await _scrape_concurrently(companies_list)
 
     # Print final summary
     logger.info("=" * 50)
@@ -441,16 +717,16 @@ async def scrape_all_companies():
     successful = sum(1 for r in all_results if r['news_scrape'] or r['linkedin_scrape'])
     failed = len(all_results) - successful
 
-    logger.info(f"Total companies processed: {len(all_results)}")
-    logger.info(f"Successful (at least partial data): {successful}")
-    logger.info(f"Failed (no data): {failed}")
+    logger.info("Total companies processed: %s", len(all_results))
+    logger.info("Successful (at least partial data): %s", successful)
+    logger.info("Failed (no data): %s", failed)
 
     for result in all_results:
         status = "OK" if result['news_scrape'] or result['linkedin_scrape'] else "FAILED"
-        logger.info(f"  - {result['company']}: {status}")
+        logger.info("  - %s: %s", result['company'], status)
         if result['errors']:
             for error in result['errors']:
-                logger.debug(f"      Error: {error}")
+                logger.debug("      Error: %s", error)
 
     return all_results
 
@@ -465,6 +741,6 @@ if __name__ == "__main__":
     companies_list = read_companies_from_csv()
 
     # To scrape a single company (for testing):
-    company, location = companies_list[0]
-    asyncio.run(scrape(company, location))
+    company, location, contact_name = companies_list[0]
+    asyncio.run(scrape(company, location, contact_name))
     
\ No newline at end of file
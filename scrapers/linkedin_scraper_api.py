@@ -1,50 +1,73 @@
+import asyncio
+import io
 import os
 import json
 import logging
+import random
 import time
+import ijson
+import orjson
 import requests
 from datetime import datetime, timedelta
 from dotenv import load_dotenv
+from utils.file_io import atomic_open, safe_filename, OUTPUT_DIR
 
 load_dotenv()
 
-logging.basicConfig(
-    level=logging.INFO,
-    format="%(asctime)s | %(levelname)s | %(name)s | %(message)s",
-)
 logger = logging.getLogger(__name__)
 
 
-def scrape_news_linkedin(company_info):
+TRIGGER_URL = "https://api.brightdata.com/datasets/v3/trigger?dataset_id=gd_lyy3tktm25m4avu764&custom_output_fields=title%2Cpost_text%2Cdate_posted&notify=false&type=discover_new&discover_by={}"
+PROGRESS_URL = "https://api.brightdata.com/datasets/v3/progress/{}"
+SNAPSHOT_URL = "https://api.brightdata.com/datasets/v3/snapshot/{}?format=json"
+MAX_WAIT = 1800  # 30 minutes max
+POLL_INITIAL = 5  # first wait between polls (seconds)
+POLL_MAX = 90  # longest wait between polls (seconds)
+POLL_GROWTH = 1.6  # wait multiplier after each poll
+
+
+def poll_delays(max_wait=MAX_WAIT):
     """
-    Scrape LinkedIn posts for a company using BrightData's API.
+    Yield snapshot poll delays: exponential backoff (5s, 8s, 12.8s, ... capped
+    at 90s) with up to 20% jitter, so quick snapshots are picked up within
+    seconds while slow ones are polled only every ~1.5 minutes.
 
     Args:
-        company_info (dict): Company information containing:
-            - name: Company name
-            - linkedin: LinkedIn company ID/slug
-            - city: Company city (optional, for logging)
+        max_wait: Total seconds to keep polling before giving up
 
-    Returns:
-        str: Path to output JSON file on success
-        None: On any failure (missing linkedin ID, API error, etc.)
+    Yields:
+        tuple: (seconds to sleep now, total seconds waited after that sleep)
     """
-    company_name = company_info.get('name', 'Unknown')
-    linkedin_id = company_info.get('linkedin')
+    interval = POLL_INITIAL
+    elapsed = 0.0
+    while elapsed < max_wait:
+        delay = interval + random.uniform(0, interval * 0.2)
+        elapsed += delay
+        yield delay, elapsed
+        interval = min(interval * POLL_GROWTH, POLL_MAX)
 
-    if not linkedin_id:
-        logger.warning(f"No LinkedIn ID available for {company_name}, skipping LinkedIn scrape")
-        return None
 
+def build_snapshot_request(label, url, output_file, discover_by="company_url", as_array=False):
+    """
+    Build everything needed to run one BrightData posts snapshot (last 30 days).
+
+    Args:
+        label: Name used in log messages (company or contact name)
+        url: LinkedIn company or profile URL to discover posts from
+        output_file: Where the downloaded posts are saved
+        discover_by: BrightData discovery mode ("company_url" or "profile_url")
+        as_array: Save a JSON array instead of NDJSON (one post per line)
+
+    Returns:
+        dict: Request settings for run_snapshot / run_snapshot_async
+        None: If BRIGHTDATA_API_KEY is not set
+    """
     # Get API key from environment
     api_key = os.getenv('BRIGHTDATA_API_KEY')
     if not api_key:
         logger.error("BRIGHTDATA_API_KEY not found in environment variables")
         return None
 
-    # Build LinkedIn company URL
-    company_url = f"https://www.linkedin.com/company/{linkedin_id}"
-
     # Calculate date range (last 30 days)
     end_date = datetime.now()
     start_date = end_date - timedelta(days=30)
@@ -53,122 +76,325 @@ def scrape_news_linkedin(company_info):
     start_date_str = start_date.strftime("%Y-%m-%dT%H:%M:%S.000Z")
     end_date_str = end_date.strftime("%Y-%m-%dT%H:%M:%S.000Z")
 
-    logger.info(f"Scraping LinkedIn posts for {company_name} from {start_date_str} to {end_date_str}")
+    logger.info("Scraping LinkedIn posts for %s from %s to %s", label, start_date_str, end_date_str)
+
+    # Built once here and reused by the trigger, every poll and the download
+    auth_headers = {"Authorization": f"Bearer {api_key}"}
+
+    return {
+        "label": label,
+        "auth_headers": auth_headers,
+        "trigger_url": TRIGGER_URL.format(discover_by),
+        "headers": {**auth_headers, "Content-Type": "application/json"},
+        "data": json.dumps({
+            "input": [{
+                "url": url,
+                "start_date": start_date_str,
+                "end_date": end_date_str
+            }],
+        }),
+        "output_file": output_file,
+        "as_array": as_array,
+    }
 
-    # Prepare output directory and file
-    script_dir = os.path.dirname(os.path.abspath(__file__))
-    project_root = os.path.dirname(script_dir)
-    output_dir = os.path.join(project_root, "data", "output")
-    os.makedirs(output_dir, exist_ok=True)
-    output_file = os.path.join(output_dir, f"{company_name} Linkedin Posts.json")
 
-    # Prepare API request
-    headers = {
-        "Authorization": f"Bearer {api_key}",
-        "Content-Type": "application/json",
-    }
+def _prepare_request(company_info):
+    """
+    Validate company inputs and build the snapshot request for its posts.
+
+    Args:
+        company_info (dict): Company information (name, linkedin, ...)
 
-    data = json.dumps({
-        "input": [{
-            "url": company_url,
-            "start_date": start_date_str,
-            "end_date": end_date_str
-        }],
-    })
+    Returns:
+        dict: Request settings (see build_snapshot_request)
+        None: If the LinkedIn ID or API key is missing
+    """
+    company_name = company_info.get('name', 'Unknown')
+    linkedin_id = company_info.get('linkedin')
 
-    try:
-        # Step 1: Trigger the scrape (async)
-        logger.info(f"Triggering BrightData scrape for {company_name}...")
-        response = requests.post(
-            "https://api.brightdata.com/datasets/v3/trigger?dataset_id=gd_lyy3tktm25m4avu764&custom_output_fields=title%2Cpost_text%2Cdate_posted&notify=false&type=discover_new&discover_by=company_url",
-            headers=headers,
-            data=data
-        )
-
-        if not response.ok:
-            logger.error(f"API error {response.status_code}: {response.text[:500]}")
-            response.raise_for_status()
-
-        snapshot_id = response.json().get("snapshot_id")
-        if not snapshot_id:
-            logger.error(f"No snapshot_id in trigger response: {response.text[:300]}")
+    if not linkedin_id:
+        logger.warning("No LinkedIn ID available for %s, skipping LinkedIn scrape", company_name)
+        return None
+
+    return build_snapshot_request(
+        company_name,
+        f"https://www.linkedin.com/company/{linkedin_id}",
+        os.path.join(OUTPUT_DIR, f"{safe_filename(company_name)} Linkedin Posts.jsonl"),
+    )
+
+
+def _trigger_snapshot(http, req):
+    """
+    Step 1: Trigger the (asynchronous) BrightData scrape.
+
+    Returns:
+        str: The snapshot_id, or None if the response did not contain one
+    """
+    logger.info("Triggering BrightData scrape for %s...", req["label"])
+    response = http.post(req["trigger_url"], headers=req["headers"], data=req["data"], timeout=(5, 30))
+
+    if not response.ok:
+        logger.error("API error %s: %s", response.status_code, response.text[:500])
+        response.raise_for_status()
+
+    snapshot_id = orjson.loads(response.content).get("snapshot_id")
+    if not snapshot_id:
+        logger.error("No snapshot_id in trigger response: %s", response.text[:300])
+        return None
+
+    logger.info("Scrape triggered, snapshot_id: %s", snapshot_id)
+    return snapshot_id
+
+
+def _check_progress(http, req, snapshot_id, elapsed):
+    """
+    Step 2: Check the snapshot status once.
+
+    Returns:
+        str: "ready", "failed", or any other status (including None when the check itself failed)
+    """
+    progress_resp = http.get(
+        PROGRESS_URL.format(snapshot_id),
+        headers=req["auth_headers"],
+        timeout=(5, 30),
+    )
+    if not progress_resp.ok:
+        logger.warning("Progress check failed (%s): %s", progress_resp.status_code, progress_resp.text[:200])
+        return None
+
+    status = orjson.loads(progress_resp.content).get("status")
+    logger.info("Snapshot %s status: %s (waited %.0fs)", snapshot_id, status, elapsed)
+
+    if status == "failed":
+        logger.error("Snapshot failed: %s", progress_resp.text[:300])
+    return status
+
+
+class _NoPosts(Exception):
+    """Raised inside the atomic write to discard it when the snapshot had no posts."""
+
+
+def _iter_snapshot_objects(raw):
+    """
+    Yield the JSON objects in a snapshot body.
+
+    BrightData normally returns an array, which is streamed item by item with
+    ijson. For a single result it can return a bare object instead; that body
+    is small, so it is parsed whole with orjson.
+
+    Args:
+        raw: Readable binary stream of the response body
+
+    Yields:
+        The parsed array items, or the single top-level object
+    """
+    body = io.BufferedReader(raw)
+    # Peek past leading whitespace to find the first JSON token without consuming it
+    while True:
+        head = body.peek(1)
+        if not head:
+            return
+        if head.lstrip():
+            break
+        body.read(len(head))
+
+    if head.lstrip()[:1] == b"{":
+        yield orjson.loads(body.read())
+    else:
+        yield from ijson.items(body, "item", use_float=True)
+
+
+def _download_snapshot(http, req, snapshot_id):
+    """
+    Step 3: Stream the snapshot download and save it (NDJSON, or a JSON array if req["as_array"]).
+
+    The snapshot (a JSON array) is parsed incrementally with ijson and each
+    post is written as soon as it is parsed, so neither the raw body nor the
+    full list of posts is ever held in memory. A bare single-post object is
+    accepted too (see _iter_snapshot_objects).
+
+    Returns:
+        str: Path to the output file, or None if no posts were downloaded
+    """
+    logger.info("Downloading snapshot %s...", snapshot_id)
+    output_file = req["output_file"]
+    as_array = req["as_array"]
+
+    with http.get(
+        SNAPSHOT_URL.format(snapshot_id),
+        headers=req["auth_headers"],
+        timeout=(5, 30),
+        stream=True,
+    ) as download_resp:
+        if not download_resp.ok:
+            logger.error("Download failed (%s): %s", download_resp.status_code, download_resp.text[:500])
             return None
 
-        logger.info(f"Scrape triggered, snapshot_id: {snapshot_id}")
+        logger.info("Download status: %s", download_resp.status_code)
+
+        # Let urllib3 undo any gzip/deflate transfer encoding for ijson
+        download_resp.raw.decode_content = True
+        n_posts = 0
+        try:
+            with atomic_open(output_file, "wb") as f:
+                if as_array:
+                    f.write(b"[")
+                for obj in _iter_snapshot_objects(download_resp.raw):
+                    if not (isinstance(obj, dict) and 'post_text' in obj):
+                        continue
+                    if as_array:
+                        f.write(b",\n" if n_posts else b"\n")
+                        f.write(orjson.dumps(obj, option=orjson.OPT_INDENT_2))
+                    else:
+                        # NDJSON (one post per line) so the summarizer can stream it
+                        f.write(orjson.dumps(obj) + b"\n")
+                    n_posts += 1
+                if not n_posts:
+                    raise _NoPosts()
+                if as_array:
+                    f.write(b"\n]\n")
+        except _NoPosts:
+            logger.warning("No posts found in snapshot for %s", req["label"])
+            return None
+
+    logger.info("Successfully saved %s posts to %s", n_posts, output_file)
+    return output_file
+
+
+def run_snapshot(req, session=None):
+    """
+    Trigger a snapshot, poll until it is ready, then download and save it.
 
-        # Step 2: Poll for completion
-        poll_url = f"https://api.brightdata.com/datasets/v3/progress/{snapshot_id}"
-        max_wait = 1800  # 30 minutes max
-        poll_interval = 60  # seconds between polls
-        elapsed = 0
+    Args:
+        req (dict): Request settings from build_snapshot_request
+        session: Optional requests.Session to reuse pooled connections (not closed here)
 
-        while elapsed < max_wait:
-            time.sleep(poll_interval)
-            elapsed += poll_interval
+    Returns:
+        str: Path to the saved posts file on success, None on any failure
+    """
+    # Keep one connection open across trigger, polls and download
+    owns_session = session is None
+    http = requests.Session() if owns_session else session
 
-            progress_resp = requests.get(poll_url, headers={"Authorization": f"Bearer {api_key}"})
-            if not progress_resp.ok:
-                logger.warning(f"Progress check failed ({progress_resp.status_code}): {progress_resp.text[:200]}")
-                continue
+    try:
+        snapshot_id = _trigger_snapshot(http, req)
+        if not snapshot_id:
+            return None
 
-            status = progress_resp.json().get("status")
-            logger.info(f"Snapshot {snapshot_id} status: {status} (waited {elapsed}s)")
+        for delay, elapsed in poll_delays():
+            time.sleep(delay)
 
+            status = _check_progress(http, req, snapshot_id, elapsed)
             if status == "ready":
                 break
             elif status == "failed":
-                logger.error(f"Snapshot failed: {progress_resp.text[:300]}")
                 return None
         else:
-            logger.error(f"Snapshot {snapshot_id} did not complete within {max_wait}s")
+            logger.error("Snapshot %s did not complete within %ss", snapshot_id, MAX_WAIT)
             return None
 
-        # Step 3: Download the snapshot
-        logger.info(f"Downloading snapshot {snapshot_id}...")
-        download_resp = requests.get(
-            f"https://api.brightdata.com/datasets/v3/snapshot/{snapshot_id}?format=json",
-            headers={"Authorization": f"Bearer {api_key}"}
-        )
+        return _download_snapshot(http, req, snapshot_id)
+
+    except requests.exceptions.RequestException as e:
+        logger.error("API request failed for %s: %s", req["label"], e)
+        return None
+    except Exception as e:
+        logger.exception("BrightData scrape failed for %s: %s", req["label"], e)
+        return None
+    finally:
+        if owns_session:
+            http.close()
 
-        if not download_resp.ok:
-            logger.error(f"Download failed ({download_resp.status_code}): {download_resp.text[:500]}")
-            return None
 
-        response_text = download_resp.text.strip()
+async def run_snapshot_async(req, session=None):
+    """
+    Async variant of run_snapshot for the batch pipeline.
 
-        logger.info(f"Download status: {download_resp.status_code}, length: {len(response_text)} characters")
+    Each HTTP call runs in a worker thread, but the wait between progress
+    polls is an asyncio.sleep, so a snapshot that takes minutes to build does
+    not pin a thread-pool worker for the whole time.
 
-        # Parse response - snapshot download returns a JSON array
-        parsed = json.loads(response_text)
-        if isinstance(parsed, list):
-            posts_data = [obj for obj in parsed if isinstance(obj, dict) and 'post_text' in obj]
-        elif isinstance(parsed, dict) and 'post_text' in parsed:
-            posts_data = [parsed]
-        else:
-            posts_data = []
+    Args:
+        req (dict): Request settings from build_snapshot_request
+        session: Optional requests.Session to reuse pooled connections (not closed here)
+
+    Returns:
+        str: Path to the saved posts file on success, None on any failure
+    """
+    # Keep one connection open across trigger, polls and download
+    owns_session = session is None
+    http = requests.Session() if owns_session else session
 
-        if not posts_data:
-            logger.error("No posts found in response")
+    try:
+        snapshot_id = await asyncio.to_thread(_trigger_snapshot, http, req)
+        if not snapshot_id:
             return None
 
-        logger.info(f"Collected {len(posts_data)} posts total")
+        for delay, elapsed in poll_delays():
+            await asyncio.sleep(delay)
 
-        # Save to JSON file
-        with open(output_file, "w", encoding="utf-8") as f:
-            json.dump(posts_data, f, indent=2, ensure_ascii=False)
+            status = await asyncio.to_thread(_check_progress, http, req, snapshot_id, elapsed)
+            if status == "ready":
+                break
+            elif status == "failed":
+                return None
+        else:
+            logger.error("Snapshot %s did not complete within %ss", snapshot_id, MAX_WAIT)
+            return None
 
-        logger.info(f"Successfully saved {len(posts_data)} posts to {output_file}")
-        return output_file
+        return await asyncio.to_thread(_download_snapshot, http, req, snapshot_id)
 
     except requests.exceptions.RequestException as e:
-        logger.error(f"API request failed for {company_name}: {e}")
+        logger.error("API request failed for %s: %s", req["label"], e)
         return None
     except Exception as e:
-        logger.exception(f"LinkedIn API scraper failed for {company_name}: {e}")
+        logger.exception("BrightData scrape failed for %s: %s", req["label"], e)
+        return None
+    finally:
+        if owns_session:
+            http.close()
+
+
+def scrape_news_linkedin(company_info, session=None):
+    """
+    Scrape LinkedIn posts for a company using BrightData's API.
+
+    Args:
+        company_info (dict): Company information containing:
+            - name: Company name
+            - linkedin: LinkedIn company ID/slug
+            - city: Company city (optional, for logging)
+        session: Optional requests.Session to reuse pooled connections (not closed here)
+
+    Returns:
+        str: Path to output NDJSON file (one post per line) on success
+        None: On any failure (missing linkedin ID, API error, etc.)
+    """
+    req = _prepare_request(company_info)
+    if req is None:
+        return None
+    return run_snapshot(req, session=session)
+
+
+async def scrape_news_linkedin_async(company_info, session=None):
+    """
+    Async variant of scrape_news_linkedin for the batch pipeline (see run_snapshot_async).
+
+    Args:
+        company_info (dict): Company information (see scrape_news_linkedin)
+        session: Optional requests.Session to reuse pooled connections (not closed here)
+
+    Returns:
+        str: Path to output NDJSON file on success, None on any failure
+    """
+    req = _prepare_request(company_info)
+    if req is None:
         return None
+    return await run_snapshot_async(req, session=session)
 
 
 if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO)
     # Test with sample company info
     company_info = {
         'hq_location': '11 Camford Street, Milton, QLD, 4064, AU',
@@ -1,18 +1,14 @@
 import os
 import asyncio
+import functools
 import random
-import csv
 import logging
-from playwright.async_api import async_playwright
+import weakref
+import orjson
+from playwright.async_api import async_playwright, TimeoutError as PlaywrightTimeoutError
 from playwright_stealth import Stealth
+from utils.file_io import atomic_open, safe_filename, OUTPUT_DIR
 
-# -------------------------------------------------------------------
-# Logging configuration
-# -------------------------------------------------------------------
-logging.basicConfig(
-    level=logging.INFO,
-    format="%(asctime)s | %(levelname)s | %(name)s | %(message)s",
-)
 logger = logging.getLogger(__name__)
 
 # Pool of recent, realistic user agents to rotate through
@@ -46,40 +42,126 @@ TIMEZONES = [
     "Australia/Melbourne",
 ]
 
+# Company pages scraped at once (one incognito context each) in a LinkedInSession.
+# Each context costs roughly 150-300MB, so size LINKEDIN_MAX_CONCURRENCY to the machine.
+BROWSER_CONCURRENCY = 2
+
+# Mouse-path points sent between sleeps in human_move_mouse
+MOUSE_MOVES_PER_SLEEP = 4
+
+# Last mouse position per page, kept in Python instead of round-tripping
+# through window._mouseX/_mouseY. Weak keys: entries go away with the page.
+_MOUSE_START = (640, 360)
+_MOUSE_POS = weakref.WeakKeyDictionary()
+
+# Selectors for the public company page, defined once per process
+_SEL_CARD = "article[data-id='main-feed-card']"
+_SEL_TEXT = "p[data-test-id='main-feed-activity-card__commentary']"
+_SEL_DATE = "time"
+_SEL_LIKES = "[data-test-id='social-actions__reaction-count']"
+_POST_SELECTORS = {"card": _SEL_CARD, "text": _SEL_TEXT, "date": _SEL_DATE, "likes": _SEL_LIKES}
+
+_SIGNIN_DISMISS_SELECTORS = (
+    "button[aria-label='Dismiss']",
+    "button.modal__dismiss",
+    "button.contextual-sign-in-modal__modal-dismiss",
+    "button.contextual-sign-in-modal__modal-dismiss-btn",
+    "icon.contextual-sign-in-modal__modal-dismiss-icon",
+)
+_SEL_MODAL = "div.modal, div[role='dialog']"
+_SEL_DDG_LINKEDIN_RESULT = "a[href*='linkedin.com/company/']"
+# Requests the scraper never needs: heavy assets and ad/analytics beacons.
+# Stylesheets stay enabled: visibility checks and lazy-loading depend on layout.
+_BLOCKED_RESOURCE_TYPES = frozenset({"image", "font", "media"})
+_BLOCKED_HOST_MARKERS = ("doubleclick.net", "px.ads.linkedin.com", "google-analytics.com", "googletagmanager.com")
+
+# Returns the first visible sign-in dismiss control as {sel, inModal}, or null
+FIND_SIGNIN_DISMISS_JS = """
+([sels, modalSel, closeSel]) => {
+    const visible = (el) => !!el &&
+        (el.checkVisibility ? el.checkVisibility() : el.getClientRects().length > 0);
+    for (const sel of sels) {
+        if (visible(document.querySelector(sel))) return {sel: sel, inModal: false};
+    }
+    const modal = document.querySelector(modalSel);
+    if (visible(modal) && visible(modal.querySelector(closeSel))) {
+        return {sel: closeSel, inModal: true};
+    }
+    return null;
+}
+"""
+# Resolves once the number of feed cards exceeds `prev` (lazy-loaded posts rendered)
+_CARDS_GREW_JS = "([sel, prev]) => document.querySelectorAll(sel).length > prev"
+SCROLL_WAIT_MS = 4000  # max wait for new cards after each scroll
+MAX_SCROLL_STALLS = 2  # stop scrolling after this many scrolls load nothing new
+_SEL_MODAL_CLOSE = "button:has(svg), button:has(li-icon)"
+
+# Extract every feed card's {date, likes, text} in a single page.evaluate() round-trip.
+# Dates are relative as shown on the page (e.g. "1d", "5w", "2mo").
+# Raw string so the JS regexes receive the "\s" and "\u2022" escapes verbatim
+# instead of Python decoding them first.
+EXTRACT_POSTS_JS = r"""
+(sel) => Array.from(document.querySelectorAll(sel.card)).map((card) => {
+    const text = card.querySelector(sel.text);
+    const date = card.querySelector(sel.date);
+    const likes = card.querySelector(sel.likes);
+    return {
+        // textContent (unlike innerText) includes text hidden behind a collapsed
+        // "see more" clamp, so no per-post expand click is needed.
+        text: text ? text.textContent.replace(/\s+/g, " ").trim() : "No Text",
+        // Keep only the relative age ("2w"), dropping any " • Edited" style tail
+        date: date ? date.textContent.replace(/\s*[\u2022\u00b7].*$/s, "").trim() : "Unknown",
+        likes: likes ? likes.innerText.trim() : "0",
+    };
+})
+"""
+
 
 # -------------------------------------------------------------------
 # Human-like behavior helpers
 # -------------------------------------------------------------------
 
+@functools.lru_cache(maxsize=None)
+def _bezier_weights(steps):
+    """Quadratic bezier basis weights (inv^2, 2*inv*t, t^2) for each step, cached per step count."""
+    weights = []
+    for i in range(steps + 1):
+        t = i / steps
+        inv = 1 - t
+        weights.append((inv * inv, 2 * inv * t, t * t))
+    return tuple(weights)
+
+
 def _bezier_points(start, end, steps):
     """Generate points along a quadratic bezier curve between start and end."""
     cx = (start[0] + end[0]) / 2 + random.uniform(-120, 120)
     cy = (start[1] + end[1]) / 2 + random.uniform(-80, 80)
+    sx, sy = start
+    ex, ey = end
 
-    points = []
-    for i in range(steps + 1):
-        t = i / steps
-        inv = 1 - t
-        x = inv * inv * start[0] + 2 * inv * t * cx + t * t * end[0]
-        y = inv * inv * start[1] + 2 * inv * t * cy + t * t * end[1]
-        points.append((int(x), int(y)))
-    return points
+    return [
+        (int(a * sx + b * cx + c * ex), int(a * sy + b * cy + c * ey))
+        for a, b, c in _bezier_weights(steps)
+    ]
 
 
 async def human_move_mouse(page, target_x, target_y):
     """Move the mouse to (target_x, target_y) along a curved path."""
-    current = await page.evaluate("() => ({x: window._mouseX || 640, y: window._mouseY || 360})")
-    start = (current["x"], current["y"])
+    start = _MOUSE_POS.get(page, _MOUSE_START)
     end = (target_x, target_y)
 
     steps = random.randint(18, 35)
     points = _bezier_points(start, end, steps)
 
-    for px, py in points:
-        await page.mouse.move(px, py)
-        await asyncio.sleep(random.uniform(0.004, 0.018))
+    # Draw all per-point delays up front and sleep once per few moves; the
+    # average cadence is unchanged but there are far fewer event-loop trips.
+    delays = [random.uniform(0.004, 0.018) for _ in points]
+    for i in range(0, len(points), MOUSE_MOVES_PER_SLEEP):
+        for px, py in points[i:i + MOUSE_MOVES_PER_SLEEP]:
+            await page.mouse.move(px, py)
+        await asyncio.sleep(sum(delays[i:i + MOUSE_MOVES_PER_SLEEP]))
 
-    await page.evaluate(f"() => {{ window._mouseX = {target_x}; window._mouseY = {target_y}; }}")
+    _MOUSE_POS[page] = end
 
 
 async def human_scroll(page, distance, direction="down"):
@@ -113,76 +195,137 @@ async def human_click_element(page, locator):
 
 
 async def human_type(page, locator, text):
-    """Type text character by character with human-like delays."""
+    """
+    Click into a field along a mouse curve, then enter the text.
+
+    The text is filled in one call followed by a single short pause, instead of
+    one keystroke round-trip (and sleep) per character.
+    """
     await human_click_element(page, locator)
     await asyncio.sleep(random.uniform(0.2, 0.5))
 
-    for char in text:
-        await page.keyboard.type(char, delay=random.uniform(40, 180))
-        if random.random() < 0.08:
-            await asyncio.sleep(random.uniform(0.2, 0.6))
+    await locator.fill(text)
+    await asyncio.sleep(random.uniform(0.3, 0.8))
 
 
 async def dismiss_signin_modal(page):
     """Detect and dismiss LinkedIn's 'Sign in' overlay modal if present."""
     try:
-        close_selectors = [
-            "button[aria-label='Dismiss']",
-            "button.modal__dismiss",
-            "button.contextual-sign-in-modal__modal-dismiss",
-            "button.contextual-sign-in-modal__modal-dismiss-btn",
-            "icon.contextual-sign-in-modal__modal-dismiss-icon",
-        ]
-        for sel in close_selectors:
-            btn = page.locator(sel).first
-            if await btn.count() > 0 and await btn.is_visible():
-                logger.info(f"Sign-in modal detected, dismissing via {sel}...")
-                await human_click_element(page, btn)
-                await asyncio.sleep(random.uniform(0.5, 1.0))
-                return True
-
-        modal = page.locator("div.modal, div[role='dialog']").first
-        if await modal.count() > 0 and await modal.is_visible():
-            x_btn = modal.locator("button:has(svg), button:has(li-icon)").first
-            if await x_btn.count() > 0 and await x_btn.is_visible():
-                logger.info("Sign-in modal detected, dismissing via X button...")
-                await human_click_element(page, x_btn)
-                await asyncio.sleep(random.uniform(0.5, 1.0))
-                return True
+        # One in-page scan instead of a count()/is_visible() pair per selector
+        hit = await page.evaluate(
+            FIND_SIGNIN_DISMISS_JS, [list(_SIGNIN_DISMISS_SELECTORS), _SEL_MODAL, _SEL_MODAL_CLOSE]
+        )
+        if not hit:
+            return False
+
+        if hit["inModal"]:
+            logger.info("Sign-in modal detected, dismissing via X button...")
+            btn = page.locator(_SEL_MODAL).first.locator(_SEL_MODAL_CLOSE).first
+        else:
+            logger.info("Sign-in modal detected, dismissing via %s...", hit["sel"])
+            btn = page.locator(hit["sel"]).first
+        await human_click_element(page, btn)
+        await asyncio.sleep(random.uniform(0.5, 1.0))
+        return True
     except Exception as e:
-        logger.debug(f"Error dismissing sign-in modal: {e}")
+        logger.debug("Error dismissing sign-in modal: %s", e)
 
     return False
 
 
-async def idle_behavior(page):
-    """Simulate idle human behavior — small random mouse drift or brief pause."""
-    action = random.random()
-    vw = 1280
-    vh = 720
-
-    if action < 0.4:
-        await human_move_mouse(page, random.randint(200, vw - 200), random.randint(150, vh - 150))
-    elif action < 0.7:
-        await asyncio.sleep(random.uniform(1.0, 3.0))
-    else:
-        nudge = random.randint(80, 200)
-        await human_scroll(page, nudge, direction="up")
-        await asyncio.sleep(random.uniform(0.5, 1.5))
-        await human_scroll(page, nudge, direction="down")
-
-
 # -------------------------------------------------------------------
 # Main scraper
 # -------------------------------------------------------------------
 
-async def scrape_news_linkedin(company_info):
+class LinkedInSession:
+    """
+    One Chromium browser shared across company scrapes, so Chromium starts once
+    per run instead of once per company. Each company still gets its own
+    incognito context (fresh fingerprint, no shared cookies).
+
+    The browser is launched lazily on the first scrape_company() call, so
+    holding a session costs nothing when the Playwright fallback is never hit.
+
+    Usage:
+        async with LinkedInSession() as session:
+            await asyncio.gather(*(session.scrape_company(c) for c in company_infos))
+    """
+
+    def __init__(self, concurrency=None):
+        if concurrency is None:
+            concurrency = int(os.getenv('LINKEDIN_MAX_CONCURRENCY', str(BROWSER_CONCURRENCY)))
+        self._sem = asyncio.BoundedSemaphore(max(1, concurrency))
+        self._lock = asyncio.Lock()
+        self._playwright_cm = None
+        self._browser = None
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc_info):
+        await self.close()
+
+    async def _get_browser(self):
+        async with self._lock:
+            if self._browser is None:
+                self._playwright_cm = Stealth().use_async(async_playwright())
+                playwright = await self._playwright_cm.__aenter__()
+                self._browser = await playwright.chromium.launch(headless=False)
+                logger.info("Launched shared Chromium browser")
+            return self._browser
+
+    async def scrape_company(self, company_info):
+        """Scrape one company in the shared browser. Same return value as scrape_news_linkedin."""
+        async with self._sem:
+            try:
+                browser = await self._get_browser()
+            except Exception as e:
+                logger.exception("Could not launch browser: %s", e)
+                return None
+            return await scrape_news_linkedin(company_info, browser=browser)
+
+    async def close(self):
+        """Close the shared browser (if it was ever launched)."""
+        if self._browser is not None:
+            try:
+                await self._browser.close()
+            except Exception:
+                pass
+            self._browser = None
+            logger.info("Shared browser closed.")
+        if self._playwright_cm is not None:
+            try:
+                await self._playwright_cm.__aexit__(None, None, None)
+            except Exception:
+                pass
+            self._playwright_cm = None
+
+
+async def scrape_many(company_infos, concurrency=None):
+    """
+    Scrape several companies' LinkedIn pages in one shared browser,
+    at most `concurrency` at a time (default: LINKEDIN_MAX_CONCURRENCY).
+
+    Returns:
+        list: Output NDJSON path (or None) for each company, in input order
+    """
+    async with LinkedInSession(concurrency) as session:
+        return await asyncio.gather(*(session.scrape_company(info) for info in company_infos))
+
+
+async def scrape_news_linkedin(company_info, browser=None):
     """
     Scrape LinkedIn posts for a company via its public page (no login required).
-    Navigates via DuckDuckGo search to appear as organic traffic.
+    Loads the company page directly with a DuckDuckGo referer; set
+    PLAYWRIGHT_ROUTE_VIA_SEARCH=true to go through a real DuckDuckGo search instead.
+
+    Args:
+        company_info: Company info dict (name, city, linkedin)
+        browser: Optional running Playwright browser to reuse (see LinkedInSession);
+            a one-off browser is launched when omitted
 
     Returns:
-        str: Path to output CSV file on success
+        str: Path to output NDJSON file (one Date/Likes/Content object per line) on success
         None: On any failure (missing linkedin ID, browser error, etc.)
     """
     company_name = company_info.get('name', 'Unknown')
@@ -190,220 +333,260 @@ async def scrape_news_linkedin(company_info):
     linkedin_id = company_info.get('linkedin')
 
     if not linkedin_id:
-        logger.warning(f"No LinkedIn ID available for {company_name}, skipping LinkedIn scrape")
+        logger.warning("No LinkedIn ID available for %s, skipping LinkedIn scrape", company_name)
         return None
 
     search_query = f"{company_name} {company_city} Linkedin"
-    script_dir = os.path.dirname(os.path.abspath(__file__))
-    project_root = os.path.dirname(script_dir)
-    output_dir = os.path.join(project_root, "data", "output")
-    os.makedirs(output_dir, exist_ok=True)
-    output_file = os.path.join(output_dir, f"{company_name} Linkedin Posts.csv")
+    output_file = os.path.join(OUTPUT_DIR, f"{safe_filename(company_name)} Linkedin Posts.jsonl")
     scroll_loops = random.randint(4, 7)
 
     try:
-        success = await run(search_query, linkedin_id, scroll_loops, output_file)
+        if browser is not None:
+            success = await _scrape_in_browser(browser, search_query, linkedin_id, scroll_loops, output_file)
+        else:
+            success = await run(search_query, linkedin_id, scroll_loops, output_file)
         if success:
             return output_file
         else:
-            logger.warning(f"LinkedIn scrape did not complete successfully for {company_name}")
+            logger.warning("LinkedIn scrape did not complete successfully for %s", company_name)
             return None
     except Exception as e:
-        logger.exception(f"LinkedIn scraper failed for {company_name}: {e}")
+        logger.exception("LinkedIn scraper failed for %s: %s", company_name, e)
         return None
 
 
+def _write_posts(output_file, posts):
+    """
+    Write extracted posts as NDJSON, one {Date, Likes, Content} object per line.
+
+    Each row is encoded with orjson (C) straight into a buffered file, with no
+    intermediate row list.
+
+    Args:
+        output_file: Destination .jsonl path (written atomically)
+        posts: List of {text, date, likes} dicts from EXTRACT_POSTS_JS
+    """
+    with atomic_open(output_file, "wb", buffering=1 << 16) as f:
+        for post in posts:
+            f.write(orjson.dumps({"Date": post["date"], "Likes": post["likes"], "Content": post["text"]}))
+            f.write(b"\n")
+
+
 async def run(search_query, linkedin_id, scroll_loops, output_file):
     """
-    Run the LinkedIn public page scraper with Playwright.
-    Each invocation uses a fresh incognito context with a randomised fingerprint.
+    Run the LinkedIn public page scraper with Playwright in a one-off browser.
+    Use LinkedInSession to share one browser across several companies.
 
     Returns:
         bool: True on success, False on failure
     """
-    browser = None
-    context = None
     try:
         async with Stealth().use_async(async_playwright()) as p:
-            # Build a unique fingerprint for this run
-            ua = random.choice(USER_AGENTS)
-            viewport = random.choice(VIEWPORTS)
-            locale = random.choice(LOCALES)
-            timezone = random.choice(TIMEZONES)
-            logger.info(
-                f"Identity: UA={ua[:40]}... "
-                f"viewport={viewport['width']}x{viewport['height']} "
-                f"locale={locale} tz={timezone}"
-            )
-
             browser = await p.chromium.launch(headless=False)
-            context = await browser.new_context(
-                user_agent=ua,
-                viewport=viewport,
-                locale=locale,
-                timezone_id=timezone,
-                color_scheme=random.choice(["light", "dark"]),
-            )
-
-            page = await context.new_page()
-
-            # --- Step 1: Go to DuckDuckGo ---
-            initial_delay = random.uniform(1, 3)
-            logger.debug(f"Waiting {initial_delay:.1f}s before navigating...")
-            await asyncio.sleep(initial_delay)
-
-            logger.info("Navigating to DuckDuckGo...")
             try:
-                await page.goto("https://duckduckgo.com", timeout=60000)
-            except Exception as e:
-                logger.warning(f"DuckDuckGo navigation warning: {e}")
-
-            await asyncio.sleep(random.uniform(1.0, 2.5))
-
-            # --- Step 2: Type search query ---
-            search_box = page.locator("input[name='q']").first
-            logger.info(f"Typing search query: {search_query}")
-            await human_type(page, search_box, search_query)
-            await asyncio.sleep(random.uniform(0.5, 1.2))
+                return await _scrape_in_browser(browser, search_query, linkedin_id, scroll_loops, output_file)
+            finally:
+                try:
+                    await browser.close()
+                except Exception:
+                    pass
+                logger.info("Browser closed. Scraping complete.")
+    except Exception as e:
+        logger.exception("LinkedIn scraper error: %s", e)
+        return False
 
-            await page.keyboard.press("Enter")
-            logger.info("Submitted DuckDuckGo search, waiting for results...")
 
-            try:
-                await page.wait_for_load_state("domcontentloaded", timeout=15000)
-            except Exception:
-                pass
-            await asyncio.sleep(random.uniform(1.5, 3.0))
+async def _block_unneeded(route):
+    """Route handler: abort images/fonts/media and tracker requests, let everything else through."""
+    request = route.request
+    if request.resource_type in _BLOCKED_RESOURCE_TYPES or any(
+        marker in request.url for marker in _BLOCKED_HOST_MARKERS
+    ):
+        await route.abort()
+    else:
+        await route.continue_()
 
-            # --- Step 3: Find and click the LinkedIn company result ---
-            # Prefer a link that matches the exact linkedin slug
-            linkedin_link = page.locator(f"a[href*='linkedin.com/company/{linkedin_id}']").first
-            if await linkedin_link.count() == 0:
-                # Fallback: any linkedin company link
-                linkedin_link = page.locator("a[href*='linkedin.com/company/']").first
 
-            if await linkedin_link.count() == 0:
-                logger.error(f"Could not find a LinkedIn company link in DuckDuckGo results for '{search_query}'")
-                await context.close()
-                await browser.close()
-                return False
+async def _navigate_via_search(page, search_query, linkedin_id):
+    """
+    Reach the company page the "organic" way: DuckDuckGo search, then click
+    the LinkedIn result. Slower than a direct goto (two extra navigations plus
+    typing), so only used when PLAYWRIGHT_ROUTE_VIA_SEARCH=true.
 
-            href = await linkedin_link.get_attribute("href")
-            logger.info(f"Found LinkedIn result: {href}. Clicking...")
-            await asyncio.sleep(random.uniform(1.0, 3.0))
-            await human_click_element(page, linkedin_link)
+    Returns:
+        bool: True once the LinkedIn result was clicked, False if none was found
+    """
+    # --- Step 1: Go to DuckDuckGo ---
+    logger.info("Navigating to DuckDuckGo...")
+    try:
+        await page.goto("https://duckduckgo.com", timeout=60000)
+    except Exception as e:
+        logger.warning("DuckDuckGo navigation warning: %s", e)
 
-            try:
-                await page.wait_for_load_state("domcontentloaded", timeout=30000)
-            except Exception:
-                pass
-            await asyncio.sleep(random.uniform(1.5, 3.0))
+    # --- Step 2: Type search query ---
+    search_box = page.locator("input[name='q']").first
+    try:
+        await search_box.wait_for(state="visible", timeout=15000)
+    except PlaywrightTimeoutError:
+        pass
+    await asyncio.sleep(random.uniform(0.3, 0.8))
+    logger.info("Typing search query: %s", search_query)
+    await human_type(page, search_box, search_query)
+    await asyncio.sleep(random.uniform(0.5, 1.2))
+
+    await page.keyboard.press("Enter")
+    logger.info("Submitted DuckDuckGo search, waiting for results...")
+
+    # Wait for result links to render rather than a fixed pause
+    try:
+        await page.locator(_SEL_DDG_LINKEDIN_RESULT).first.wait_for(timeout=15000)
+    except PlaywrightTimeoutError:
+        pass
+    await asyncio.sleep(random.uniform(0.5, 1.2))
+
+    # --- Step 3: Find and click the LinkedIn company result ---
+    # Prefer a link that matches the exact linkedin slug
+    linkedin_link = page.locator(f"a[href*='linkedin.com/company/{linkedin_id}']").first
+    if await linkedin_link.count() == 0:
+        # Fallback: any linkedin company link
+        linkedin_link = page.locator(_SEL_DDG_LINKEDIN_RESULT).first
+
+    if await linkedin_link.count() == 0:
+        logger.error("Could not find a LinkedIn company link in DuckDuckGo results for '%s'", search_query)
+        return False
 
-            # --- Step 4: Dismiss sign-in modal if present ---
-            await dismiss_signin_modal(page)
+    href = await linkedin_link.get_attribute("href")
+    logger.info("Found LinkedIn result: %s. Clicking...", href)
+    await asyncio.sleep(random.uniform(0.5, 1.5))
+    await human_click_element(page, linkedin_link)
+    return True
 
-            current_url = page.url
-            logger.info(f"Landed on: {current_url}")
 
-            # Handle LinkedIn auth/captcha walls
-            if "login" in page.url or "authwall" in page.url or "signup" in page.url:
-                logger.error("LinkedIn auth wall hit — page requires login (expected for guest)")
-                await context.close()
-                await browser.close()
-                return False
+async def _scrape_in_browser(browser, search_query, linkedin_id, scroll_loops, output_file):
+    """
+    Scrape one company in an already-running browser.
+    Each call uses a fresh incognito context with a randomised fingerprint,
+    which is closed again before returning.
 
-            if "checkpoint/challenge" in page.url or "security-verification" in page.url:
-                logger.error("LinkedIn CAPTCHA/security check detected")
-                await context.close()
-                await browser.close()
+    Returns:
+        bool: True on success, False on failure
+    """
+    context = None
+    try:
+        # Build a unique fingerprint for this run
+        ua = random.choice(USER_AGENTS)
+        viewport = random.choice(VIEWPORTS)
+        locale = random.choice(LOCALES)
+        timezone = random.choice(TIMEZONES)
+        logger.info(
+            "Identity: UA=%s... viewport=%sx%s locale=%s tz=%s",
+            ua[:40], viewport['width'], viewport['height'], locale, timezone,
+        )
+
+        context = await browser.new_context(
+            user_agent=ua,
+            viewport=viewport,
+            locale=locale,
+            timezone_id=timezone,
+            color_scheme=random.choice(["light", "dark"]),
+        )
+
+        await context.route("**/*", _block_unneeded)
+
+        page = await context.new_page()
+
+        if os.getenv('PLAYWRIGHT_ROUTE_VIA_SEARCH', 'false').lower() == 'true':
+            if not await _navigate_via_search(page, search_query, linkedin_id):
                 return False
+        else:
+            # Go straight to the known company page, as if arriving from a search
+            company_url = f"https://www.linkedin.com/company/{linkedin_id}"
+            logger.info("Navigating directly to %s", company_url)
+            await page.goto(
+                company_url,
+                referer="https://duckduckgo.com/",
+                timeout=60000,
+                wait_until="domcontentloaded",
+            )
 
-            # --- Step 5: Scroll down to the Updates section ---
-            read_delay = random.uniform(2, 5)
-            logger.debug(f"Reading page for {read_delay:.1f}s before scrolling...")
-            await asyncio.sleep(read_delay)
-
-            await human_move_mouse(page, random.randint(400, 900), random.randint(300, 500))
-
-            logger.info(f"Starting scroll loop ({scroll_loops} scrolls)...")
-            for i in range(scroll_loops):
-                scroll_distance = random.randint(600, 1400)
-                await human_scroll(page, scroll_distance, direction="down")
-                logger.debug(f"Scroll {i + 1}/{scroll_loops} ({scroll_distance}px)")
-
-                await asyncio.sleep(random.uniform(0.5, 2.5))
-
-                # Dismiss sign-in modal if it reappears during scrolling
-                await dismiss_signin_modal(page)
-
-                if random.random() < 0.3:
-                    await idle_behavior(page)
+        # Proceed as soon as the company page shows posts (or the sign-in modal)
+        try:
+            await page.wait_for_load_state("domcontentloaded", timeout=30000)
+            await page.wait_for_selector(f"{_SEL_CARD}, {_SEL_MODAL}", timeout=10000)
+        except Exception:
+            pass
+        await asyncio.sleep(random.uniform(0.3, 0.8))
+
+        # --- Step 4: Dismiss sign-in modal if present ---
+        await dismiss_signin_modal(page)
+
+        current_url = page.url
+        logger.info("Landed on: %s", current_url)
+
+        # Handle LinkedIn auth/captcha walls
+        if "login" in page.url or "authwall" in page.url or "signup" in page.url:
+            logger.error("LinkedIn auth wall hit — page requires login (expected for guest)")
+            return False
+
+        if "checkpoint/challenge" in page.url or "security-verification" in page.url:
+            logger.error("LinkedIn CAPTCHA/security check detected")
+            return False
+
+        # --- Step 5: Scroll down to the Updates section ---
+        read_delay = random.uniform(0.5, 1.5)
+        logger.debug("Reading page for %.1fs before scrolling...", read_delay)
+        await asyncio.sleep(read_delay)
+
+        await human_move_mouse(page, random.randint(400, 900), random.randint(300, 500))
+
+        logger.info("Starting scroll loop (up to %s scrolls)...", scroll_loops)
+        card_count = await page.locator(_SEL_CARD).count()
+        stalls = 0
+        for i in range(scroll_loops):
+            scroll_distance = random.randint(600, 1400)
+            await human_scroll(page, scroll_distance, direction="down")
+            logger.debug("Scroll %s/%s (%spx)", i + 1, scroll_loops, scroll_distance)
+
+            # Wait only until new cards render instead of a blind sleep
+            try:
+                await page.wait_for_function(
+                    _CARDS_GREW_JS, arg=[_SEL_CARD, card_count], timeout=SCROLL_WAIT_MS
+                )
+                card_count = await page.locator(_SEL_CARD).count()
+                stalls = 0
+            except PlaywrightTimeoutError:
+                stalls += 1
+                if stalls >= MAX_SCROLL_STALLS:
+                    logger.debug("No new posts after %s scrolls, stopping early", stalls)
+                    break
+            await asyncio.sleep(random.uniform(0.2, 0.6))
 
-                if random.random() < 0.15:
-                    back_up = random.randint(100, 350)
-                    await human_scroll(page, back_up, direction="up")
-                    await asyncio.sleep(random.uniform(1.0, 2.5))
-                    await human_scroll(page, back_up, direction="down")
+            # Dismiss sign-in modal if it reappears during scrolling
+            await dismiss_signin_modal(page)
 
-            # --- Step 6: Extract posts from the Updates section ---
-            posts = await page.locator("article[data-id='main-feed-card']").all()
-            logger.info(f"Found {len(posts)} posts. Parsing...")
+        # --- Step 6: Extract posts from the Updates section ---
+        posts = await page.evaluate(EXTRACT_POSTS_JS, _POST_SELECTORS)
+        logger.info("Found %s posts", len(posts))
 
-            extracted_data = []
+        # Write off the event loop so other companies' pages keep progressing
+        await asyncio.to_thread(_write_posts, output_file, posts)
 
-            for idx, post in enumerate(posts):
-                try:
-                    # Extract text
-                    text = "No Text"
-                    text_loc = post.locator("p[data-test-id='main-feed-activity-card__commentary']").first
-                    if await text_loc.count() > 0:
-                        text = await text_loc.inner_text()
-
-                    # Extract date (e.g. "1d", "5w", "2mo")
-                    date = "Unknown"
-                    date_loc = post.locator("time").first
-                    if await date_loc.count() > 0:
-                        date = (await date_loc.inner_text()).strip()
-
-                    # Extract reaction count
-                    likes = "0"
-                    likes_loc = post.locator("[data-test-id='social-actions__reaction-count']").first
-                    if await likes_loc.count() > 0:
-                        likes = (await likes_loc.inner_text()).strip()
-
-                    extracted_data.append([date, likes, text.replace('\n', ' ').strip()])
-                    logger.debug(f"Parsed post {idx + 1}: date={date}, likes={likes}")
-
-                    await asyncio.sleep(random.uniform(0.3, 1.0))
-
-                except Exception as e:
-                    logger.warning(f"Error parsing post {idx + 1}, skipping: {e}")
-                    continue
-
-            # Save to CSV
-            with open(output_file, "w", newline="", encoding="utf-8") as f:
-                writer = csv.writer(f)
-                writer.writerow(["Date", "Likes", "Content"])
-                writer.writerows(extracted_data)
-
-            logger.info(f"Successfully saved {len(extracted_data)} posts to {output_file}")
-            await context.close()
-            await browser.close()
-            logger.info("Browser closed. Scraping complete.")
-            return True
+        logger.info("Successfully saved %s posts to %s", len(posts), output_file)
+        return True
 
     except Exception as e:
-        logger.exception(f"LinkedIn scraper error: {e}")
-        for closeable in (context, browser):
-            if closeable:
-                try:
-                    await closeable.close()
-                except Exception:
-                    pass
+        logger.exception("LinkedIn scraper error: %s", e)
         return False
+    finally:
+        if context:
+            try:
+                await context.close()
+            except Exception:
+                pass
 
 
 if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO)
     company_info = {
         'hq_location': '11 Camford Street, '
         'Milton, QLD, 4064, AU', 
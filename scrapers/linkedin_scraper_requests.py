@@ -4,15 +4,15 @@ import json
 import time
 import random
 import logging
+import orjson
 import requests
+from lxml import etree
+from lxml import html as lxml_html
 from dotenv import load_dotenv
+from utils.file_io import atomic_open, safe_filename, OUTPUT_DIR
 
 load_dotenv()
 
-logging.basicConfig(
-    level=logging.INFO,
-    format="%(asctime)s | %(levelname)s | %(name)s | %(message)s",
-)
 logger = logging.getLogger(__name__)
 
 # Pool of realistic user agents to rotate
@@ -35,8 +35,24 @@ ACCEPT_LANGUAGES = [
     "en-US,en;q=0.9,es;q=0.8",
 ]
 
+# XPath expressions compiled once per process
+_XP_CARDS = etree.XPath("//article[@data-id='main-feed-card']")
+_XP_CARD_TEXT = etree.XPath("string(.//p[@data-test-id='main-feed-activity-card__commentary'])")
+_XP_CARD_DATE = etree.XPath("string(.//time)")
+_XP_POST_TEXT = etree.XPath(
+    "//*[@data-test-id='main-feed-activity-card__commentary']"
+    " | //div[contains(@class, 'feed-shared-update-v2__description')]"
+    " | //div[contains(@class, 'update-components-text')]"
+    " | //*[contains(concat(' ', normalize-space(@class), ' '), ' break-words ')]"
+)
+
+# Regexes compiled once per process
+_RE_CODE_BLOCK = re.compile(r'<code[^>]*><!--(.+?)--></code>', re.DOTALL)
+_RE_LD_JSON = re.compile(r'<script[^>]*type="application/ld\+json"[^>]*>(.*?)</script>', re.DOTALL)
+_RE_WS = re.compile(r'\s+')
+
 
-def scrape_news_linkedin(company_info):
+def scrape_news_linkedin(company_info, session=None):
     """
     Scrape LinkedIn posts for a company using plain GET requests with anti-bot measures.
 
@@ -46,34 +62,33 @@ def scrape_news_linkedin(company_info):
     - Random delays (3-10s) to mimic human behavior
     - Session cookies to appear like a persistent browser
     - Referer header to simulate navigation
-    - Multiple extraction strategies (JSON, ld+json, HTML)
+    - Multiple extraction strategies (JSON, ld+json, HTML via lxml XPath)
 
     Args:
         company_info (dict): Company information containing:
             - name: Company name
             - linkedin: LinkedIn company ID/slug
+        session: Optional requests.Session to reuse (not closed here)
 
     Returns:
-        str: Path to output JSON file on success
+        str: Path to output NDJSON file (one post per line) on success
         None: On any failure
     """
     company_name = company_info.get("name", "Unknown")
     linkedin_id = company_info.get("linkedin")
 
     if not linkedin_id:
-        logger.warning(f"No LinkedIn ID for {company_name}, skipping")
+        logger.warning("No LinkedIn ID for %s, skipping", company_name)
         return None
 
     url = f"https://www.linkedin.com/company/{linkedin_id}"
 
-    script_dir = os.path.dirname(os.path.abspath(__file__))
-    project_root = os.path.dirname(script_dir)
-    output_dir = os.path.join(project_root, "data", "output")
-    os.makedirs(output_dir, exist_ok=True)
-    output_file = os.path.join(output_dir, f"{company_name} Linkedin Posts.json")
+    output_file = os.path.join(OUTPUT_DIR, f"{safe_filename(company_name)} Linkedin Posts.jsonl")
 
-    # Create a session to maintain cookies (acts like a real browser)
-    session = requests.Session()
+    # Use a session to maintain cookies (acts like a real browser)
+    owns_session = session is None
+    if owns_session:
+        session = requests.Session()
 
     # Rotate user agent and language
     user_agent = random.choice(USER_AGENTS)
@@ -102,18 +117,18 @@ def scrape_news_linkedin(company_info):
     try:
         # Random delay to simulate human behavior (3-10s)
         delay = random.uniform(3, 10)
-        logger.info(f"Waiting {delay:.1f}s before request (anti-bot measure)...")
+        logger.info("Waiting %.1fs before request (anti-bot measure)...", delay)
         time.sleep(delay)
 
-        logger.info(f"GET {url} (UA: {user_agent[:60]}...)")
+        logger.info("GET %s (UA: %s...)", url, user_agent[:60])
         resp = session.get(
             url,
             headers=headers,
-            timeout=30,
+            timeout=(5, 30),
             allow_redirects=True,
         )
 
-        logger.info(f"Status: {resp.status_code}, Final URL: {resp.url}, Length: {len(resp.text)}")
+        logger.info("Status: %s, Final URL: %s, Length: %s", resp.status_code, resp.url, len(resp.text))
 
         # Status 999 = LinkedIn anti-bot response
         if resp.status_code == 999:
@@ -122,7 +137,7 @@ def scrape_news_linkedin(company_info):
 
         # Check for auth walls or blocks
         if "authwall" in resp.url or "login" in resp.url or "checkpoint" in resp.url:
-            logger.error(f"Redirected to auth wall or checkpoint: {resp.url}")
+            logger.error("Redirected to auth wall or checkpoint: %s", resp.url)
             return None
 
         resp.raise_for_status()
@@ -132,10 +147,8 @@ def scrape_news_linkedin(company_info):
 
         # Strategy 1: Extract from <code> elements containing JSON state
         # LinkedIn embeds serialized data in <code> tags
-        code_blocks = re.findall(
-            r'<code[^>]*><!--(.+?)--></code>', html, re.DOTALL
-        )
-        logger.info(f"Found {len(code_blocks)} embedded <code> blocks")
+        code_blocks = _RE_CODE_BLOCK.findall(html)
+        logger.info("Found %s embedded <code> blocks", len(code_blocks))
 
         for block in code_blocks:
             try:
@@ -145,11 +158,8 @@ def scrape_news_linkedin(company_info):
                 continue
 
         # Strategy 2: Extract from application/ld+json
-        ld_blocks = re.findall(
-            r'<script[^>]*type="application/ld\+json"[^>]*>(.*?)</script>',
-            html, re.DOTALL
-        )
-        logger.info(f"Found {len(ld_blocks)} ld+json blocks")
+        ld_blocks = _RE_LD_JSON.findall(html)
+        logger.info("Found %s ld+json blocks", len(ld_blocks))
 
         for block in ld_blocks:
             try:
@@ -158,7 +168,7 @@ def scrape_news_linkedin(company_info):
             except (json.JSONDecodeError, TypeError):
                 continue
 
-        # Strategy 3: Regex fallback for post text in HTML
+        # Strategy 3: Parse the rendered feed cards in the HTML
         if not posts:
             logger.info("Trying HTML element extraction...")
             _extract_posts_from_html(html, posts)
@@ -176,22 +186,24 @@ def scrape_news_linkedin(company_info):
             logger.error("No posts found in response")
             return None
 
-        logger.info(f"Extracted {len(unique_posts)} unique posts")
+        logger.info("Extracted %s unique posts", len(unique_posts))
 
-        with open(output_file, "w", encoding="utf-8") as f:
-            json.dump(unique_posts, f, indent=2, ensure_ascii=False)
+        with atomic_open(output_file, "wb") as f:
+            for post in unique_posts:
+                f.write(orjson.dumps(post) + b"\n")
 
-        logger.info(f"Saved to {output_file}")
+        logger.info("Saved to %s", output_file)
         return output_file
 
     except requests.exceptions.RequestException as e:
-        logger.error(f"Request failed: {e}")
+        logger.error("Request failed: %s", e)
         return None
     except Exception as e:
-        logger.exception(f"Scraper failed: {e}")
+        logger.exception("Scraper failed: %s", e)
         return None
     finally:
-        session.close()
+        if owns_session:
+            session.close()
 
 
 def _extract_posts_from_data(data, posts):
@@ -268,30 +280,37 @@ def _extract_posts_from_ld(data, posts):
 
 
 def _extract_posts_from_html(html, posts):
-    """Extract post content directly from HTML elements."""
-    # LinkedIn renders post text in specific data-test-id elements
-    patterns = [
-        r'data-test-id="main-feed-activity-card__commentary"[^>]*>(.*?)</(?:p|div)>',
-        r'class="feed-shared-update-v2__description[^"]*"[^>]*>(.*?)</div>',
-        r'class="update-components-text[^"]*"[^>]*>(.*?)</div>',
-        r'class="break-words[^"]*"[^>]*>(.*?)</(?:p|div|span)>',
-    ]
-    for pattern in patterns:
-        matches = re.findall(pattern, html, re.DOTALL | re.IGNORECASE)
-        for match in matches:
-            # Strip HTML tags and clean up
-            clean = re.sub(r"<[^>]+>", "", match).strip()
-            # Remove excessive whitespace
-            clean = re.sub(r'\s+', ' ', clean)
-            if clean and len(clean) > 20:
-                posts.append({
-                    "title": "",
-                    "post_text": clean,
-                    "date_posted": "",
-                })
+    """Extract post content directly from HTML elements (parsed once with lxml)."""
+    try:
+        tree = lxml_html.fromstring(html)
+    except (etree.ParserError, ValueError):
+        return
+
+    # Public company pages render each post as a feed card (same markup the Playwright scraper reads)
+    for card in _XP_CARDS(tree):
+        clean = _RE_WS.sub(' ', _XP_CARD_TEXT(card)).strip()
+        if clean and len(clean) > 20:
+            posts.append({
+                "title": "",
+                "post_text": clean,
+                "date_posted": _XP_CARD_DATE(card).strip(),
+            })
+    if posts:
+        return
+
+    # Fallback: any known post-text container, without dates
+    for node in _XP_POST_TEXT(tree):
+        clean = _RE_WS.sub(' ', node.text_content()).strip()
+        if clean and len(clean) > 20:
+            posts.append({
+                "title": "",
+                "post_text": clean,
+                "date_posted": "",
+            })
 
 
 if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO)
     company_info = {
         "hq_location": "11 Camford Street, Milton, QLD, 4064, AU",
         "linkedin": "axcelerate-student-training-rto-management-systems",
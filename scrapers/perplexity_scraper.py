@@ -2,17 +2,13 @@ import os
 import json
 import asyncio
 import logging
+import orjson
 from dotenv import load_dotenv
-from perplexity import Perplexity
+from perplexity import AsyncPerplexity
 from datetime import datetime, timedelta
+from utils.file_io import atomic_open, safe_filename, OUTPUT_DIR
+from utils.llm_cache import cached_chat_async, PERPLEXITY_TTL
 
-# -------------------------------------------------------------------
-# Logging configuration
-# -------------------------------------------------------------------
-logging.basicConfig(
-    level=logging.INFO,  # change to DEBUG for more verbosity
-    format="%(asctime)s | %(levelname)s | %(name)s | %(message)s",
-)
 logger = logging.getLogger(__name__)
 
 # -------------------------------------------------------------------
@@ -20,7 +16,9 @@ logger = logging.getLogger(__name__)
 # -------------------------------------------------------------------
 load_dotenv()
 
-client = Perplexity()
+# Async client so concurrent companies' news requests overlap on the event
+# loop instead of blocking it for the length of each Perplexity call
+client = AsyncPerplexity()
 
 article_schema = {
     "type": "json_schema",
@@ -52,6 +50,24 @@ article_schema = {
     }
 }
 
+# How far back each timeframe searches
+TIMEFRAME_LOOKBACK = {
+    "year": timedelta(days=365),
+    "month": timedelta(days=30),
+    "week": timedelta(days=7),
+    "day": timedelta(days=1),
+}
+
+# Australian business news sites searched alongside the company's own website
+NEWS_DOMAINS = (
+    "afr.com",
+    "insidesmallbusiness.com.au",
+    "dynamicbusiness.com",
+    "smartcompany.com.au",
+    "startupdaily.net",
+    "businessnews.com.au",
+)
+
 def parse_date(article):
     """
     Parses the date string in DD/MM/YYYY format. 
@@ -59,12 +75,23 @@ def parse_date(article):
     """
     date_str = article.get("date", "")
     try:
-        # Changed from "%d %B %Y" to "%d/%m/%Y"
-        return datetime.strptime(date_str, "%d/%m/%Y")
-    except (ValueError, TypeError):
-        logger.warning(f"Could not parse date: '{date_str}'. Sorting to end.")
+        # Fixed DD/MM/YYYY layout: build the datetime from the parts instead of strptime
+        day, month, year = date_str.split("/")
+        return datetime(int(year), int(month), int(day))
+    except (ValueError, TypeError, AttributeError):
+        logger.warning("Could not parse date: '%s'. Sorting to end.", date_str)
         return datetime.min
 
+def _write_news(filename, data):
+    """
+    Write the news result JSON atomically.
+    Compact, like the pipeline's final write that replaces it; indented only at DEBUG level.
+    """
+    option = orjson.OPT_INDENT_2 if logger.isEnabledFor(logging.DEBUG) else 0
+    with atomic_open(filename, "wb") as f:
+        f.write(orjson.dumps(data, option=option))
+
+
 async def scrape_news_perplexity(company_info, timeframe):
     company_name = company_info['name']
     company_city = company_info['city']
@@ -72,19 +99,14 @@ async def scrape_news_perplexity(company_info, timeframe):
     company_website = company_info['website']
     company_industry = company_info['industry']
 
-    start_date = None 
-    now = datetime.now()
-
-    if timeframe == "year":
-        start_date = (now - timedelta(days=365)).strftime("%-m/%-d/%Y")
-    elif timeframe == "month":
-        start_date = (now - timedelta(days=30)).strftime("%-m/%-d/%Y")
-    elif timeframe == "week":
-        start_date = (now - timedelta(days=7)).strftime("%-m/%-d/%Y")
-    elif timeframe == "day":
-        start_date = (now - timedelta(days=1)).strftime("%-m/%-d/%Y")
+    start_date = None
+    lookback = TIMEFRAME_LOOKBACK.get(timeframe)
+    if lookback is not None:
+        # M/D/YYYY without zero padding; built by hand since %-m/%-d is glibc-only
+        start = datetime.now() - lookback
+        start_date = f"{start.month}/{start.day}/{start.year}"
 
-    logger.info(f"Starting news pull for company={company_name}, location={company_city} after {start_date}")
+    logger.info("Starting news pull for company=%s, location=%s after %s", company_name, company_city, start_date)
 
     try:
         hq_sentence = (
@@ -102,22 +124,16 @@ async def scrape_news_perplexity(company_info, timeframe):
             "Only return news for this specific company and location, do not confuse it with other companies with similar names."
         )
 
-        logger.info(f"User prompt: {user_prompt}")
+        logger.info("User prompt: %s", user_prompt)
 
         logger.info("Sending request to Perplexity model")
-        domains = [company_website, 
-                   "afr.com", 
-                   "insidesmallbusiness.com.au", 
-                   "dynamicbusiness.com",
-                   "smartcompany.com.au",
-                   "startupdaily.net",
-                   "businessnews.com.au",
-                  ]
-        
-        for domain in domains:
-            logger.info(f"Scraping {domain}")
-
-        response = client.chat.completions.create(
+        # Company site first; dict.fromkeys drops it if it's already a news domain
+        domains = list(dict.fromkeys((company_website, *NEWS_DOMAINS)))
+        logger.info("Scraping %s", domains)
+
+        content = await cached_chat_async(
+                        client,
+                        PERPLEXITY_TTL,
                         messages=[
                             {
                                 "role": "user",
@@ -136,8 +152,7 @@ async def scrape_news_perplexity(company_info, timeframe):
                         response_format=article_schema
                     )
 
-        content = response.choices[0].message.content
-        data = json.loads(content)
+        data = orjson.loads(content)
 
         data["articles"] = sorted(
             data["articles"],
@@ -151,23 +166,14 @@ async def scrape_news_perplexity(company_info, timeframe):
             company_name
         )
 
-        # 1. Get the project root directory (parent of 'scrapers' folder)
-        script_dir = os.path.dirname(os.path.abspath(__file__))
-        project_root = os.path.dirname(script_dir)
-        output_dir = os.path.join(project_root, "data", "output")
-
-        # 2. Create the 'data/output' directory if it doesn't exist
-        os.makedirs(output_dir, exist_ok=True)
-
-        # 3. Construct the filename (e.g., "data/output/LAB Group.json")
+        # Construct the filename (e.g., "data/output/LAB Group.json")
         # Using .get("company") ensures we use the exact name returned by the AI
-        filename = os.path.join(output_dir, f"{data.get('company', company_name)}.json")
+        filename = os.path.join(OUTPUT_DIR, f"{safe_filename(data.get('company', company_name))}.json")
 
-        # 4. Save the result
-        with open(filename, "w", encoding="utf-8") as f:
-            json.dump(data, f, indent=2)
+        # Save the result (off the event loop)
+        await asyncio.to_thread(_write_news, filename, data)
 
-        logger.info(f"Result saved to {filename}")
+        logger.info("Result saved to %s", filename)
 
         return filename
 
@@ -179,6 +185,7 @@ async def scrape_news_perplexity(company_info, timeframe):
 # Entrypoint
 # -------------------------------------------------------------------
 if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO)
     # single scrape
     company_info = {
         'hq_location': '201 Kent St, Level 14, Sydney, NSW, 2000, AU', 
@@ -8,10 +8,6 @@ from email.mime.text import MIMEText
 from pathlib import Path
 from typing import Optional
 
-logging.basicConfig(
-    level=logging.INFO,
-    format="%(asctime)s | %(levelname)s | %(name)s | %(message)s",
-)
 logger = logging.getLogger(__name__)
 
 load_dotenv()
@@ -213,16 +209,16 @@ class EmailClient:
                 server.starttls()
                 server.login(self.smtp_user, self.smtp_password)
                 server.sendmail(self.sender_email, recipients, msg.as_string())
-            logger.info(f"Email sent to {recipients}")
+            logger.info("Email sent to %s", recipients)
             return True
         except smtplib.SMTPAuthenticationError as e:
-            logger.error(f"SMTP authentication failed: {e}")
+            logger.error("SMTP authentication failed: %s", e)
             return False
         except smtplib.SMTPException as e:
-            logger.error(f"SMTP error: {e}")
+            logger.error("SMTP error: %s", e)
             return False
         except Exception as e:
-            logger.error(f"Failed to send email: {e}")
+            logger.error("Failed to send email: %s", e)
             return False
 
     def send_company_report(self, company_data: dict, recipients: list[str]) -> bool:
@@ -239,31 +235,31 @@ def load_json_files(output_dir: str = "data/output") -> list[dict]:
     output_path = script_dir / output_dir
 
     if not output_path.exists():
-        logger.warning(f"Output directory not found: {output_path}")
+        logger.warning("Output directory not found: %s", output_path)
         return []
 
     json_files = list(output_path.glob("*.json"))
-    logger.info(f"Found {len(json_files)} JSON files in {output_path}")
+    logger.info("Found %s JSON files in %s", len(json_files), output_path)
 
     data = []
     for json_file in json_files:
         # Skip LinkedIn Posts files (they are intermediate files, not company reports)
         if "Linkedin Posts" in json_file.name or "Contact Posts" in json_file.name:
-            logger.debug(f"Skipping intermediate file: {json_file.name}")
+            logger.debug("Skipping intermediate file: %s", json_file.name)
             continue
         try:
             with open(json_file, "r", encoding="utf-8") as f:
                 company_data = json.load(f)
                 # Validate it's a company report dict, not a posts list
                 if not isinstance(company_data, dict) or "company" not in company_data:
-                    logger.warning(f"Skipping {json_file.name}: not a valid company report")
+                    logger.warning("Skipping %s: not a valid company report", json_file.name)
                     continue
                 data.append(company_data)
-                logger.debug(f"Loaded {json_file.name}")
+                logger.debug("Loaded %s", json_file.name)
         except json.JSONDecodeError as e:
-            logger.error(f"Failed to parse {json_file.name}: {e}")
+            logger.error("Failed to parse %s: %s", json_file.name, e)
         except Exception as e:
-            logger.error(f"Error reading {json_file.name}: {e}")
+            logger.error("Error reading %s: %s", json_file.name, e)
 
     return data
 
@@ -290,7 +286,7 @@ def send_all_reports(recipients: list[str], output_dir: str = "data/output") ->
             results["failed"] += 1
             results["companies"].append({"company": company_name, "status": "failed"})
 
-    logger.info(f"Email summary: {results['sent']} sent, {results['failed']} failed")
+    logger.info("Email summary: %s sent, %s failed", results['sent'], results['failed'])
     return results
 
 
@@ -486,14 +482,14 @@ def load_owner_mapping(input_dir: str = "data/input") -> dict | None:
     mapping_path = script_dir / input_dir / "owner_mapping.json"
 
     if not mapping_path.exists():
-        logger.warning(f"Owner mapping not found at {mapping_path}")
+        logger.warning("Owner mapping not found at %s", mapping_path)
         return None
 
     try:
         with open(mapping_path, "r", encoding="utf-8") as f:
             return json.load(f)
     except Exception as e:
-        logger.error(f"Failed to load owner mapping: {e}")
+        logger.error("Failed to load owner mapping: %s", e)
         return None
 
 
@@ -531,7 +527,7 @@ def send_owner_digests(
         owner_companies = [company_lookup[name] for name in company_names if name in company_lookup]
 
         if not owner_companies:
-            logger.warning(f"No scraped data for {owner_email}'s companies: {company_names}")
+            logger.warning("No scraped data for %s's companies: %s", owner_email, company_names)
             continue
 
         html = _build_digest_html(owner_companies)
@@ -540,7 +536,7 @@ def send_owner_digests(
         success = client.send_email([owner_email], subject, html)
         if success:
             results["owners_sent"] += 1
-            logger.info(f"Sent digest to {owner_email}: {[c.get('company') for c in owner_companies]}")
+            logger.info("Sent digest to %s: %s", owner_email, [c.get('company') for c in owner_companies])
         else:
             results["owners_failed"] += 1
 
@@ -551,12 +547,12 @@ def send_owner_digests(
             subject = f"Growth Intelligence Digest (Unassigned) - {len(unmapped_data)} Companies"
             results["fallback_sent"] = client.send_email(fallback_recipients, subject, html)
     elif unmapped_names:
-        logger.warning(f"Unmapped companies with no fallback recipients: {unmapped_names}")
+        logger.warning("Unmapped companies with no fallback recipients: %s", unmapped_names)
 
     logger.info(
-        f"Owner digests: {results['owners_sent']} sent, "
-        f"{results['owners_failed']} failed, "
-        f"fallback={'sent' if results['fallback_sent'] else 'not sent'}"
+        "Owner digests: %s sent, %s failed, fallback=%s",
+        results['owners_sent'], results['owners_failed'],
+        'sent' if results['fallback_sent'] else 'not sent',
     )
     return results
 
@@ -604,6 +600,7 @@ def send_alert_email(recipients: list[str], subject: str, message: str) -> bool:
 
 
 if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO)
     import sys
 
     if len(sys.argv) < 2:
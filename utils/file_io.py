@@ -0,0 +1,60 @@
+import os
+import re
+from contextlib import contextmanager
+
+# Project paths, resolved once per process
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+OUTPUT_DIR = os.path.join(PROJECT_ROOT, "data", "output")
+os.makedirs(OUTPUT_DIR, exist_ok=True)
+
+# Characters that are invalid in file names on Windows (and '/' everywhere)
+_UNSAFE_FILENAME_CHARS = re.compile(r'[<>:"/\\|?*\x00-\x1f]')
+
+
+def safe_filename(name, max_len=120):
+    """
+    Make a company/contact name safe to use as a file name on any OS.
+
+    Invalid characters become "_", trailing dots/spaces (rejected by Windows)
+    are dropped and the result is capped at `max_len`. Ordinary names such as
+    "LAB Group" or "A&B (Aust) Pty Ltd" come back unchanged.
+
+    Args:
+        name: Raw name (e.g. from companies.csv or an API response)
+        max_len: Maximum length of the returned name
+
+    Returns:
+        str: The sanitised name ("unnamed" if nothing is left)
+    """
+    safe = _UNSAFE_FILENAME_CHARS.sub("_", str(name))[:max_len].rstrip(". ")
+    return safe or "unnamed"
+
+
+@contextmanager
+def atomic_open(path, mode="w", **kwargs):
+    """
+    Open `path` for writing without ever exposing a partial file.
+
+    Writes go to `<path>.part`, which is moved over `path` with os.replace()
+    only once the block completes. If the block raises (or the process dies),
+    the previous contents of `path` are left untouched and the .part file is removed.
+
+    Args:
+        path: Final file path
+        mode: Write mode passed to open() ("w" or "wb")
+        **kwargs: Extra open() arguments (encoding, newline, ...)
+
+    Yields:
+        The open file object for the temporary .part file
+    """
+    part_path = path + ".part"
+    try:
+        with open(part_path, mode, **kwargs) as f:
+            yield f
+        os.replace(part_path, path)
+    except BaseException:
+        try:
+            os.remove(part_path)
+        except OSError:
+            pass
+        raise
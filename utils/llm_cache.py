@@ -0,0 +1,161 @@
+import os
+import time
+import asyncio
+import hashlib
+import logging
+import sqlite3
+import orjson
+from utils.file_io import PROJECT_ROOT
+
+logger = logging.getLogger(__name__)
+
+# Completed chat responses are cached on disk keyed by the exact request, so
+# re-running the same companies within the TTL skips the API call entirely.
+# Any prompt or schema edit changes the key, so no manual versioning is needed.
+# Delete the file (or set USE_LLM_CACHE=false) to force fresh answers.
+LLM_CACHE_PATH = os.path.join(PROJECT_ROOT, "data", "cache", "llm.sqlite")
+os.makedirs(os.path.dirname(LLM_CACHE_PATH), exist_ok=True)
+
+PERPLEXITY_TTL = 24 * 60 * 60      # news goes stale quickly
+OPENAI_TTL = 7 * 24 * 60 * 60      # post analysis and outreach for unchanged inputs
+
+_schema_ready = False
+
+
+def _connect():
+    """Open the cache database, creating the table (and dropping expired rows) on first use."""
+    global _schema_ready
+    conn = sqlite3.connect(LLM_CACHE_PATH, timeout=10)
+    if not _schema_ready:
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute(
+            "CREATE TABLE IF NOT EXISTS responses ("
+            "key TEXT PRIMARY KEY, content TEXT NOT NULL, expires_at REAL NOT NULL)"
+        )
+        conn.execute("DELETE FROM responses WHERE expires_at <= ?", (time.time(),))
+        conn.commit()
+        _schema_ready = True
+    return conn
+
+
+def _cache_enabled():
+    """Read at call time so .env values loaded by the entry point are honoured."""
+    return os.getenv('USE_LLM_CACHE', 'true').lower() == 'true'
+
+
+def _usable(content, request):
+    """Structured (response_format) answers must still parse as JSON to be stored or reused."""
+    if not content:
+        return False
+    if "response_format" not in request:
+        return True
+    try:
+        orjson.loads(content)
+        return True
+    except orjson.JSONDecodeError:
+        return False
+
+
+def cache_key(**request):
+    """
+    Hash a chat completion request into a cache key.
+
+    Args:
+        **request: The keyword arguments passed to chat.completions.create
+            (model, messages, response_format, web_search_options, ...)
+
+    Returns:
+        str: Hex sha256 of the request serialised with sorted keys
+    """
+    return hashlib.sha256(orjson.dumps(request, option=orjson.OPT_SORT_KEYS)).hexdigest()
+
+
+def get_cached(key):
+    """Return the cached response content for `key`, or None if missing/expired."""
+    try:
+        conn = _connect()
+        try:
+            row = conn.execute(
+                "SELECT content FROM responses WHERE key = ? AND expires_at > ?",
+                (key, time.time()),
+            ).fetchone()
+        finally:
+            conn.close()
+    except sqlite3.Error as e:
+        logger.warning("LLM cache read failed: %s", e)
+        return None
+    return row[0] if row else None
+
+
+def set_cached(key, content, ttl):
+    """Store response content for `key`, valid for `ttl` seconds."""
+    try:
+        conn = _connect()
+        try:
+            conn.execute(
+                "INSERT OR REPLACE INTO responses (key, content, expires_at) VALUES (?, ?, ?)",
+                (key, content, time.time() + ttl),
+            )
+            conn.commit()
+        finally:
+            conn.close()
+    except sqlite3.Error as e:
+        logger.warning("LLM cache write failed: %s", e)
+
+
+def cached_chat(client, ttl, **request):
+    """
+    Run a chat completion through the on-disk cache.
+
+    Args:
+        client: An OpenAI-compatible sync client
+        ttl: Seconds a fresh response stays valid
+        **request: Keyword arguments for client.chat.completions.create
+
+    Returns:
+        str: The response message content
+    """
+    if not _cache_enabled():
+        return client.chat.completions.create(**request).choices[0].message.content
+
+    key = cache_key(**request)
+    content = get_cached(key)
+    if content is not None and _usable(content, request):
+        logger.info("LLM cache hit (%s)", request.get("model"))
+        return content
+
+    response = client.chat.completions.create(**request)
+    content = response.choices[0].message.content
+    if _usable(content, request):
+        set_cached(key, content, ttl)
+    return content
+
+
+async def cached_chat_async(client, ttl, **request):
+    """
+    Async variant of cached_chat for async clients (e.g. AsyncPerplexity).
+
+    The SQLite lookups run in a worker thread so they never block the event loop.
+
+    Args:
+        client: An OpenAI-compatible async client
+        ttl: Seconds a fresh response stays valid
+        **request: Keyword arguments for client.chat.completions.create
+
+    Returns:
+        str: The response message content
+    """
+    if not _cache_enabled():
+        return (await client.chat.completions.create(**request)).choices[0].message.content
+
+    key = cache_key(**request)
+    content = await asyncio.to_thread(get_cached, key)
+    if content is not None and _usable(content, request):
+        logger.info("LLM cache hit (%s)", request.get("model"))
+        return content
+
+    response = await client.chat.completions.create(**request)
+    content = response.choices[0].message.content
+    if _usable(content, request):
+        await asyncio.to_thread(set_cached, key, content, ttl)
+    return content
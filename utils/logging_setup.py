@@ -0,0 +1,16 @@
+import logging
+
+LOG_FORMAT = "%(asctime)s | %(levelname)s | %(name)s | %(message)s"
+
+
+def setup_logging(level=logging.INFO):
+    """
+    Configure root logging for the pipeline.
+
+    Library modules only create their own logger; entry points (main.py,
+    scraper.py) call this once. Like logging.basicConfig, repeat calls are no-ops.
+
+    Args:
+        level: Root log level (logging.DEBUG for more verbosity)
+    """
+    logging.basicConfig(level=level, format=LOG_FORMAT)
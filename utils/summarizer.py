@@ -1,26 +1,62 @@
 import os
 import csv
-import json
+import math
 import logging
+import functools
+import threading
+import orjson
+from concurrent.futures import ThreadPoolExecutor
 from dotenv import load_dotenv
-from openai import OpenAI
+from utils.file_io import atomic_open
+from utils.llm_cache import cached_chat, OPENAI_TTL
 from datetime import datetime, timedelta
 import re
 
-# -------------------------------------------------------------------
-# Logging configuration
-# -------------------------------------------------------------------
-logging.basicConfig(
-    level=logging.INFO,
-    format="%(asctime)s | %(levelname)s | %(name)s | %(message)s",
-)
 logger = logging.getLogger(__name__)
 
 # -------------------------------------------------------------------
 # Setup
 # -------------------------------------------------------------------
 load_dotenv()
-client = OpenAI()
+
+# The OpenAI client is built on first use, so importing this module (e.g. for
+# the posts-file or date helpers) doesn't pay for the SDK import or need a key
+_client = None
+_client_lock = threading.Lock()
+
+
+def _get_client():
+    """Return the shared OpenAI client, creating it on first call (thread-safe)."""
+    global _client
+    if _client is None:
+        with _client_lock:
+            if _client is None:
+                from openai import OpenAI
+                _client = OpenAI()
+    return _client
+
+
+# Runs independent OpenAI requests (potential actions, post-analysis chunks)
+# alongside the calling thread
+_OPENAI_POOL = ThreadPoolExecutor(max_workers=8, thread_name_prefix="openai")
+
+# Companies with more posts than this are analyzed in parallel chunks
+POSTS_BATCH_SIZE = 30
+
+# Post text beyond this many characters (~500 tokens) is not sent to the model
+MAX_POST_CHARS = 2000
+
+# Relative post dates like '1h', '1d', '2w', '3mo', '4y'
+_RELATIVE_DATE_RE = re.compile(r'(\d+)(h|d|w|mo|y)')
+
+# Length of one relative-date unit (months/years approximated as 30/365 days)
+_RELATIVE_UNIT_DELTA = {
+    'h': timedelta(hours=1),
+    'd': timedelta(days=1),
+    'w': timedelta(weeks=1),
+    'mo': timedelta(days=30),
+    'y': timedelta(days=365),
+}
 
 # Define the schema for batch LinkedIn post analysis
 posts_batch_schema = {
@@ -107,6 +143,41 @@ contact_posts_schema = {
     }
 }
 
+# Define the schema for potential actions
+actions_schema = {
+    "type": "json_schema",
+    "json_schema": {
+        "name": "potential_actions",
+        "schema": {
+            "type": "object",
+            "properties": {
+                "actions": {
+                    "type": "array",
+                    "description": "5-7 engagement actions",
+                    "items": {
+                        "type": "object",
+                        "properties": {
+                            "title": {
+                                "type": "string",
+                                "description": "Concise one-line title, plain text"
+                            },
+                            "explanation": {
+                                "type": "string",
+                                "description": "2-3 sentences on why the action fits the signal and what value it creates, plain text"
+                            }
+                        },
+                        "required": ["title", "explanation"],
+                        "additionalProperties": False
+                    }
+                }
+            },
+            "required": ["actions"],
+            "additionalProperties": False
+        },
+        "strict": True
+    }
+}
+
 
 def summarize_contact_posts(contact_posts_filepath, contact_name):
     """
@@ -121,22 +192,23 @@ def summarize_contact_posts(contact_posts_filepath, contact_name):
         None: On failure
     """
     if not contact_posts_filepath or not os.path.exists(contact_posts_filepath):
-        logger.warning(f"Contact posts file not found: {contact_posts_filepath}")
+        logger.warning("Contact posts file not found: %s", contact_posts_filepath)
         return None
 
     try:
         posts = parse_posts_file(contact_posts_filepath)
         if not posts:
-            logger.warning(f"No contact posts found for {contact_name}")
+            logger.warning("No contact posts found for %s", contact_name)
             return []
 
-        logger.info(f"Summarizing {len(posts)} contact posts for {contact_name}")
+        logger.info("Summarizing %s contact posts for %s", len(posts), contact_name)
 
-        posts_text = ""
-        for i, post in enumerate(posts):
-            posts_text += f"Post #{i}:\n- Date: {post['Date']}\n- Content: {post['Content']}\n\n"
+        posts_text = "".join(
+            f"Post #{i}:\n- Date: {post['Date']}\n- Content: {post['Content']}\n\n"
+            for i, post in enumerate(posts)
+        )
 
-        response = client.chat.completions.create(
+        response = _get_client().chat.completions.create(
             model="gpt-4o-mini",
             messages=[
                 {
@@ -158,33 +230,59 @@ def summarize_contact_posts(contact_posts_filepath, contact_name):
             response_format=contact_posts_schema,
         )
 
-        result = json.loads(response.choices[0].message.content)
+        result = orjson.loads(response.choices[0].message.content)
         summaries = result.get("posts", [])
 
+        today = datetime.now()
         for s in summaries:
-            date_str = s.get("date", "Unknown")
-            if date_str and '/' in date_str and len(date_str) == 10:
-                absolute_date = date_str
-                relative_date = calculate_relative_date(absolute_date)
-            else:
-                relative_date = date_str
-                absolute_date = convert_relative_date_to_absolute(relative_date)
+            absolute_date, relative_date = resolve_post_date(s.get("date", "Unknown"), today)
             s["date"] = absolute_date + " - " + relative_date
 
         summaries.sort(key=lambda x: parse_date_for_sorting(x['date']), reverse=True)
 
-        logger.info(f"Summarized {len(summaries)} contact posts for {contact_name}")
+        logger.info("Summarized %s contact posts for %s", len(summaries), contact_name)
         return summaries
 
     except Exception as e:
-        logger.exception(f"Failed to summarize contact posts for {contact_name}: {e}")
+        logger.exception("Failed to summarize contact posts for %s: %s", contact_name, e)
         return None
 
 
-def parse_posts_file(filepath):
+def _has_text(post):
+    """True if a normalised post has real content worth sending to the model."""
+    content = (post.get('Content') or '').strip()
+    return bool(content) and content != 'No Text'
+
+
+def _normalize_api_post(post):
+    """Convert a scraped post object (API/requests scrapers) to a Date/Likes/Content dict."""
+    # Playwright rows are already in Date/Likes/Content shape
+    if 'Content' in post:
+        return post
+
+    # Extract date from date_posted field (ISO format)
+    date_posted = post.get('date_posted', 'Unknown')
+    if date_posted and date_posted != 'Unknown':
+        try:
+            # Parse ISO date and format as DD/MM/YYYY (matching Perplexity format)
+            dt = datetime.fromisoformat(date_posted.replace('Z', '+00:00'))
+            formatted_date = dt.strftime("%d/%m/%Y")
+        except Exception:
+            formatted_date = date_posted
+    else:
+        formatted_date = 'Unknown'
+
+    return {
+        'Date': formatted_date,
+        'Likes': '0',  # API doesn't provide likes
+        'Content': post.get('post_text', 'No Text')
+    }
+
+
+def iter_posts_file(filepath):
     """
-    Parse posts from either JSON or CSV format.
-    Returns a list of dicts with keys: Date, Likes, Content
+    Stream posts from an NDJSON, JSON or CSV file, one normalised post at a time.
+    Yields dicts with keys: Date, Likes, Content
     """
     if not os.path.exists(filepath):
         raise FileNotFoundError(f"Posts file not found: {filepath}")
@@ -192,45 +290,47 @@ def parse_posts_file(filepath):
     # Determine file type by extension
     file_ext = os.path.splitext(filepath)[1].lower()
 
-    if file_ext == '.json':
-        # Parse JSON format (from API scraper)
-        logger.info(f"Parsing JSON posts file: {filepath}")
-        with open(filepath, 'r', encoding='utf-8') as file:
-            json_data = json.load(file)
-
-        # Convert JSON format to expected format
-        data = []
+    if file_ext == '.jsonl':
+        # Parse NDJSON format (from all company scrapers), one post per line
+        logger.info("Parsing NDJSON posts file: %s", filepath)
+        with open(filepath, 'rb') as file:
+            for line in file:
+                if line.strip():
+                    yield _normalize_api_post(orjson.loads(line))
+
+    elif file_ext == '.json':
+        # Parse JSON array format (from contact scraper); these are small, so one orjson parse beats streaming
+        logger.info("Parsing JSON posts file: %s", filepath)
+        with open(filepath, 'rb') as file:
+            json_data = orjson.loads(file.read())
         for post in json_data:
-            # Extract date from date_posted field (ISO format)
-            date_posted = post.get('date_posted', 'Unknown')
-            if date_posted and date_posted != 'Unknown':
-                try:
-                    # Parse ISO date and format as DD/MM/YYYY (matching Perplexity format)
-                    dt = datetime.fromisoformat(date_posted.replace('Z', '+00:00'))
-                    formatted_date = dt.strftime("%d/%m/%Y")
-                except Exception:
-                    formatted_date = date_posted
-            else:
-                formatted_date = 'Unknown'
-
-            data.append({
-                'Date': formatted_date,
-                'Likes': '0',  # API doesn't provide likes
-                'Content': post.get('post_text', 'No Text')
-            })
-
-        return data
+            yield _normalize_api_post(post)
 
     elif file_ext == '.csv':
-        # Parse CSV format (from Playwright scraper)
-        logger.info(f"Parsing CSV posts file: {filepath}")
-        with open(filepath, 'r', encoding='utf-8') as file:
-            reader = csv.DictReader(file)
-            data = list(reader)
-        return data
+        # Parse CSV format (Playwright output from older runs)
+        logger.info("Parsing CSV posts file: %s", filepath)
+        with open(filepath, 'r', encoding='utf-8', newline='') as file:
+            reader = csv.reader(file)
+            header = next(reader, None)
+            if header is None:
+                return
+            # Resolve column positions once instead of building a full dict per row
+            date_i, likes_i, content_i = (header.index(col) for col in ('Date', 'Likes', 'Content'))
+            for row in reader:
+                if not row:
+                    continue  # blank line (DictReader skipped these too)
+                yield {'Date': row[date_i], 'Likes': row[likes_i], 'Content': row[content_i]}
 
     else:
-        raise ValueError(f"Unsupported file format: {file_ext}. Expected .json or .csv")
+        raise ValueError(f"Unsupported file format: {file_ext}. Expected .jsonl, .json or .csv")
+
+
+def parse_posts_file(filepath):
+    """
+    Parse posts from NDJSON, JSON or CSV format.
+    Returns a list of dicts with keys: Date, Likes, Content
+    """
+    return list(iter_posts_file(filepath))
 
 
 # Keep backward compatibility
@@ -239,125 +339,195 @@ def parse_csv(filepath):
     return parse_posts_file(filepath)
 
 
-def analyze_posts_batch_with_openai(posts):
+def _format_post_for_prompt(index, post):
     """
-    Analyze multiple LinkedIn posts at once using OpenAI to determine which indicate growth.
-    Returns a list of structured JSON objects with summary, growth_type, and date.
+    Render one post for the analysis prompt.
+
+    Content is capped at MAX_POST_CHARS (the opening of a post carries the news;
+    long tails are hashtags and boilerplate), and the Likes line is omitted when
+    it is the "0" placeholder the API scrapers fill in.
     """
-    try:
-        # Build the batch prompt with all posts
-        posts_text = ""
-        for i, post in enumerate(posts):
-            posts_text += f"""
-                            Post #{i}:
-                            - Date: {post['Date']}
-                            - Likes: {post['Likes']}
-                            - Content: {post['Content']}
-
-                            """
-
-        user_prompt = f"""
-        Analyze these LinkedIn posts and determine which ones indicate company growth.
-
-        Growth indicators include:
-        - Awards and recognition
-        - Business expansion
-        - New hires or team growth
-        - Partnerships or collaborations
-        - Patents or innovations
-        - Financial success or funding
-        - Product launches or major updates
-        - Market expansion
-        - Client acquisitions
-
-        For each post, determine if it indicates growth.
-        Provide a brief summary, identify the growth type, and extract the date.
-
-        {posts_text}
-
-        Analyze all {len(posts)} posts above.
-        """
-
-        response = client.chat.completions.create(
-            model="gpt-4o-mini",
-            messages=[
-                {
-                    "role": "system",
-                    "content": "You are an expert business analyst who identifies company growth indicators from social media posts."
-                },
-                {
-                    "role": "user",
-                    "content": user_prompt
-                }
-            ],
-            response_format=posts_batch_schema
-        )
+    content = post['Content']
+    if len(content) > MAX_POST_CHARS:
+        content = content[:MAX_POST_CHARS] + "..."
+    likes = post.get('Likes')
+    likes_line = f"- Likes: {likes}\n" if likes and likes != '0' else ""
+    return f"Post #{index}:\n- Date: {post['Date']}\n{likes_line}- Content: {content}\n"
 
-        result = json.loads(response.choices[0].message.content)
-        logger.info(f"Analyzed {len(result['posts'])} posts in batch")
 
-        return result['posts']
+def _analyze_posts_chunk(posts, offset=0):
+    """
+    Run one growth-analysis request for a slice of posts.
 
-    except Exception as e:
-        logger.exception(f"Failed to analyze posts batch: {e}")
-        return []  # Return empty list to allow workflow to continue
+    Args:
+        posts: Normalised posts (Date/Likes/Content)
+        offset: Index of posts[0] in the full list, added to each post_index
+
+    Returns:
+        list: Analysis objects for this slice
+    """
+    # Build the prompt for this slice (no indentation: every space is an input token)
+    posts_text = "\n".join(_format_post_for_prompt(i, post) for i, post in enumerate(posts))
+
+    user_prompt = (
+        "Analyze these LinkedIn posts and determine which ones indicate company growth.\n\n"
+        "Growth indicators include:\n"
+        "- Awards and recognition\n"
+        "- Business expansion\n"
+        "- New hires or team growth\n"
+        "- Partnerships or collaborations\n"
+        "- Patents or innovations\n"
+        "- Financial success or funding\n"
+        "- Product launches or major updates\n"
+        "- Market expansion\n"
+        "- Client acquisitions\n\n"
+        "For each post, determine if it indicates growth.\n"
+        "Provide a brief summary, identify the growth type, and extract the date.\n\n"
+        f"{posts_text}\n"
+        f"Analyze all {len(posts)} posts above."
+    )
 
+    content = cached_chat(
+        _get_client(),
+        OPENAI_TTL,
+        model="gpt-4o-mini",
+        messages=[
+            {
+                "role": "system",
+                "content": "You are an expert business analyst who identifies company growth indicators from social media posts."
+            },
+            {
+                "role": "user",
+                "content": user_prompt
+            }
+        ],
+        response_format=posts_batch_schema
+    )
+
+    result = orjson.loads(content)
+    analyzed = result['posts']
+    for analysis in analyzed:
+        if isinstance(analysis.get('post_index'), int):
+            analysis['post_index'] += offset
+    return analyzed
 
-def convert_relative_date_to_absolute(relative_date):
+
+def analyze_posts_batch_with_openai(posts):
     """
-    Convert relative date strings (e.g., '1h', '1d', '2w', '3mo') to absolute dates in DD/MM/YYYY format.
+    Analyze multiple LinkedIn posts at once using OpenAI to determine which indicate growth.
+    Up to POSTS_BATCH_SIZE posts go in one request; larger sets are split into
+    chunks that are sent concurrently and merged back in order.
+    Returns a list of structured JSON objects with summary, growth_type, and date.
+    """
+    if len(posts) <= POSTS_BATCH_SIZE:
+        try:
+            analyzed = _analyze_posts_chunk(posts)
+        except Exception as e:
+            logger.exception("Failed to analyze posts batch: %s", e)
+            return []  # Return empty list to allow workflow to continue
+    else:
+        futures = [
+            (i, _OPENAI_POOL.submit(_analyze_posts_chunk, posts[i:i + POSTS_BATCH_SIZE], i))
+            for i in range(0, len(posts), POSTS_BATCH_SIZE)
+        ]
+        # Collect every chunk on its own so one failure keeps the (already billed) others
+        analyzed = []
+        for offset, future in futures:
+            try:
+                analyzed.extend(future.result())
+            except Exception as e:
+                logger.exception(
+                    "Failed to analyze posts %s-%s: %s",
+                    offset + 1, min(offset + POSTS_BATCH_SIZE, len(posts)), e,
+                )
+
+    logger.info("Analyzed %s posts in batch", len(analyzed))
+    return analyzed
+
+
+def count_openai_requests(posts_filepath):
     """
-    today = datetime.now()
+    Number of OpenAI requests summarize_posts_data will make for a posts file,
+    so callers can reserve rate-limit capacity up front.
 
-    # Pattern to match relative dates like '1h', '1d', '2w', '3mo', '4y'
-    match = re.match(r'(\d+)(h|d|w|mo|y)', relative_date.lower().strip())
+    Args:
+        posts_filepath: Path to the LinkedIn posts file (.jsonl, .json or .csv)
+
+    Returns:
+        int: One request per POSTS_BATCH_SIZE text posts plus the reachout message
+            and potential actions, or 0 when the file has no posts at all
+    """
+    total_posts = text_posts = 0
+    try:
+        for post in iter_posts_file(posts_filepath):
+            total_posts += 1
+            text_posts += _has_text(post)
+    except (OSError, ValueError) as e:
+        logger.warning("Could not count posts in %s: %s", posts_filepath, e)
+        return 0
+    if not total_posts:
+        return 0
+    return math.ceil(text_posts / POSTS_BATCH_SIZE) + 2
+
+
+def convert_relative_date_to_absolute(relative_date, today=None):
+    """
+    Convert relative date strings (e.g., '1h', '1d', '2w', '3mo') to absolute dates in DD/MM/YYYY format.
+
+    Args:
+        relative_date: Relative date string as shown on LinkedIn
+        today: Reference time; pass one shared value when converting a batch of posts
+
+    Returns:
+        str: Date in DD/MM/YYYY format, or the input unchanged if it can't be parsed
+    """
+    match = _RELATIVE_DATE_RE.match(relative_date.lower().strip())
 
     if not match:
-        logger.warning(f"Could not parse relative date: {relative_date}")
+        logger.warning("Could not parse relative date: %s", relative_date)
         return relative_date  # Return as-is if can't parse
 
-    amount = int(match.group(1))
-    unit = match.group(2)
-
-    if unit == 'h':
-        target_date = today - timedelta(hours=amount)
-    elif unit == 'd':
-        target_date = today - timedelta(days=amount)
-    elif unit == 'w':
-        target_date = today - timedelta(weeks=amount)
-    elif unit == 'mo':
-        # Approximate months as 30 days
-        target_date = today - timedelta(days=amount * 30)
-    elif unit == 'y':
-        target_date = today - timedelta(days=amount * 365)
-    else:
-        logger.warning(f"Unknown unit in relative date: {relative_date}")
-        return relative_date
+    if today is None:
+        today = datetime.now()
+
+    target_date = today - int(match.group(1)) * _RELATIVE_UNIT_DELTA[match.group(2)]
 
     # Return in DD/MM/YYYY format to match the perplexity scraper format
     return target_date.strftime("%d/%m/%Y")
 
 
-def calculate_relative_date(absolute_date_str):
+@functools.lru_cache(maxsize=4096)
+def _parse_absolute_date(date_str):
+    """
+    Parse a DD/MM/YYYY (Perplexity/Playwright) or YYYY-MM-DD (API) date.
+    Cached because the same few dates repeat across a company's posts.
+
+    Raises:
+        ValueError: If the string matches neither format
+    """
+    try:
+        return datetime.strptime(date_str, "%d/%m/%Y")
+    except ValueError:
+        return datetime.strptime(date_str, "%Y-%m-%d")
+
+
+def calculate_relative_date(absolute_date_str, today=None):
     """
     Calculate relative date format (e.g., "2w", "1mo") from absolute date.
 
     Args:
         absolute_date_str: Date string in YYYY-MM-DD or DD/MM/YYYY format
+        today: Reference time; pass one shared value when converting a batch of posts
 
     Returns:
         Relative date string like "1d", "2w", "1mo", "3y" or the original if parsing fails
     """
     try:
-        # Try parsing YYYY-MM-DD format first
-        try:
-            date_obj = datetime.strptime(absolute_date_str, "%Y-%m-%d")
-        except ValueError:
-            # Try DD/MM/YYYY format
-            date_obj = datetime.strptime(absolute_date_str, "%d/%m/%Y")
+        date_obj = _parse_absolute_date(absolute_date_str)
 
         # Calculate difference from today
-        today = datetime.now()
+        if today is None:
+            today = datetime.now()
         delta = today - date_obj
 
         days = delta.days
@@ -384,6 +554,26 @@ def calculate_relative_date(absolute_date_str):
         return absolute_date_str
 
 
+def resolve_post_date(date_str, today=None):
+    """
+    Turn a post date from the model into its absolute and relative forms.
+
+    The model returns DD/MM/YYYY for API/Perplexity posts and LinkedIn's
+    relative form (e.g. "2w") for Playwright posts; only the missing form
+    is computed.
+
+    Args:
+        date_str: Date as returned by the analysis
+        today: Reference time shared by the whole batch
+
+    Returns:
+        tuple: (absolute_date, relative_date)
+    """
+    if date_str and '/' in date_str and len(date_str) == 10:
+        return date_str, calculate_relative_date(date_str, today)
+    return convert_relative_date_to_absolute(date_str, today), date_str
+
+
 def parse_date_for_sorting(date_str):
     """
     Parse date string for sorting.
@@ -395,16 +585,9 @@ def parse_date_for_sorting(date_str):
     """
     try:
         # Extract just the date part before the " - " separator
-        date_part = date_str.split(' - ')[0].strip()
-
-        # Try DD/MM/YYYY format first (Playwright CSV)
-        try:
-            return datetime.strptime(date_part, "%d/%m/%Y")
-        except ValueError:
-            # Try YYYY-MM-DD format (API JSON)
-            return datetime.strptime(date_part, "%Y-%m-%d")
+        return _parse_absolute_date(date_str.partition(' - ')[0].strip())
     except (ValueError, TypeError, IndexError):
-        logger.warning(f"Could not parse date for sorting: '{date_str}'. Sorting to end.")
+        logger.warning("Could not parse date for sorting: '%s'. Sorting to end.", date_str)
         return datetime.min
 
 
@@ -413,10 +596,10 @@ def generate_potential_actions(company_name, growth_posts, company_data=None):
     Generate potential actions for investment analysts based on company growth signals.
     Returns a list of actionable items from a private equity perspective.
     """
-    logger.info(f"Generating potential actions for {company_name}")
+    logger.info("Generating potential actions for %s", company_name)
 
     if not growth_posts and not company_data:
-        logger.warning(f"No growth posts or company data for {company_name}, returning default actions")
+        logger.warning("No growth posts or company data for %s, returning default actions", company_name)
         return ["Schedule introductory call with founders", "Research competitive landscape"]
 
     # Build context from growth posts
@@ -436,7 +619,9 @@ def generate_potential_actions(company_name, growth_posts, company_data=None):
         )
 
     try:
-        response = client.chat.completions.create(
+        content = cached_chat(
+            _get_client(),
+            OPENAI_TTL,
             model="gpt-4o-mini",
             messages=[
                 {
@@ -466,51 +651,29 @@ def generate_potential_actions(company_name, growth_posts, company_data=None):
                         "- A concise title (one line)\n"
                         "- 2-3 sentences explaining: why this action is relevant to the specific signal, "
                         "what value it creates, and why it is differentiated (not generic outreach)\n\n"
-                        "Format each action as:\n"
-                        "Title\n"
-                        "Explanation sentences.\n\n"
                         "Use plain text only. No markdown, no bold, no numbering, no bullets."
                     ),
                 },
             ],
+            response_format=actions_schema,
         )
-        actions_text = response.choices[0].message.content.strip()
-
-        # Parse title + explanation blocks into array
-        # Each action is a title line followed by explanation lines, separated by blank lines
-        actions = []
-        current_action = []
-        for line in actions_text.split('\n'):
-            line = line.strip()
-            # Remove markdown formatting
-            line = line.replace('**', '').replace('*', '')
-            # Remove leading numbering (1., 2., etc.)
-            if line and line[0].isdigit() and len(line) > 3:
-                line = line.lstrip('0123456789.-) ').strip()
-
-            if not line:
-                # Blank line = end of current action block
-                if current_action:
-                    actions.append('\n'.join(current_action))
-                    current_action = []
-            else:
-                current_action.append(line)
-
-        # Don't forget the last block
-        if current_action:
-            actions.append('\n'.join(current_action))
-
-        # Filter out very short entries (likely parsing artifacts)
-        actions = [a for a in actions if len(a) > 30]
+
+        # Each action is stored as "Title\nExplanation" (the email template splits on the first line)
+        actions = [
+            f"{a['title'].strip()}\n{a['explanation'].strip()}"
+            for a in orjson.loads(content)['actions']
+            if a['title'].strip() and a['explanation'].strip()
+        ]
 
         if not actions:
-            actions = [actions_text]
+            logger.warning("No potential actions returned for %s, using defaults", company_name)
+            return ["Schedule introductory call with founders", "Research competitive landscape"]
 
-        logger.info(f"Generated {len(actions)} potential actions for {company_name}")
+        logger.info("Generated %s potential actions for %s", len(actions), company_name)
         return actions
 
     except Exception as e:
-        logger.exception(f"Failed to generate potential actions: {e}")
+        logger.exception("Failed to generate potential actions: %s", e)
         return ["Schedule introductory call with founders", "Research competitive landscape"]
 
 
@@ -520,7 +683,7 @@ def generate_reachout_message(company_name, growth_posts, company_data=None):
     Uses growth posts when available, falls back to news articles.
     Returns the message string, or an empty string on failure.
     """
-    logger.info(f"Generating LinkedIn reachout message for {company_name} based on {len(growth_posts)} growth posts")
+    logger.info("Generating LinkedIn reachout message for %s based on %s growth posts", company_name, len(growth_posts))
 
     # Build context from growth posts
     posts_summary = ""
@@ -539,7 +702,7 @@ def generate_reachout_message(company_name, growth_posts, company_data=None):
         )
 
     if not posts_summary and not articles_summary:
-        logger.warning(f"No growth posts or articles for {company_name}, skipping reachout message")
+        logger.warning("No growth posts or articles for %s, skipping reachout message", company_name)
         return ""
 
     # Build the signals section
@@ -550,7 +713,9 @@ def generate_reachout_message(company_name, growth_posts, company_data=None):
         signals += f"Recent news:\n{articles_summary}\n"
 
     try:
-        response = client.chat.completions.create(
+        content = cached_chat(
+            _get_client(),
+            OPENAI_TTL,
             model="gpt-4o-mini",
             messages=[
                 {
@@ -586,14 +751,41 @@ def generate_reachout_message(company_name, growth_posts, company_data=None):
                 },
             ],
         )
-        message = response.choices[0].message.content.strip()
-        logger.info(f"Generated reachout message for {company_name}")
+        message = content.strip()
+        logger.info("Generated reachout message for %s", company_name)
         return message
     except Exception as e:
-        logger.exception(f"Failed to generate reachout message: {e}")
+        logger.exception("Failed to generate reachout message: %s", e)
         return ""
 
 
+def generate_outreach(company_name, growth_posts, company_data=None):
+    """
+    Generate the reachout message and potential actions for a company.
+
+    The two OpenAI requests are independent, so the actions request runs on
+    a worker thread while this thread waits on the message. A company then
+    takes one round-trip of latency here instead of two.
+
+    Returns:
+        tuple: (message, potential_actions), same values as the individual generators
+    """
+    actions_future = _OPENAI_POOL.submit(generate_potential_actions, company_name, growth_posts, company_data)
+    message = generate_reachout_message(company_name, growth_posts, company_data)
+    return message, actions_future.result()
+
+
+def add_posts_to_news_data(news_data, posts_data, message="", potential_actions=None):
+    """
+    Add the analyzed posts, message and potential_actions (required) to an
+    in-memory news dict. Mutates news_data in place.
+    """
+    news_data['posts'] = posts_data
+    news_data['message'] = message
+    # Ensure potential_actions always exists
+    news_data['potential_actions'] = potential_actions if potential_actions else []
+
+
 def add_posts_to_news_file(news_filepath, posts_data, message="", potential_actions=None):
     """
     Add the analyzed posts to the news JSON file under a 'posts' field.
@@ -601,128 +793,153 @@ def add_posts_to_news_file(news_filepath, posts_data, message="", potential_acti
     """
     try:
         # Read existing news file
-        with open(news_filepath, 'r', encoding='utf-8') as f:
-            news_data = json.load(f)
+        with open(news_filepath, 'rb') as f:
+            news_data = orjson.loads(f.read())
 
-        # Add posts, message, and potential_actions fields
-        news_data['posts'] = posts_data
-        news_data['message'] = message
-        # Ensure potential_actions always exists
-        news_data['potential_actions'] = potential_actions if potential_actions else []
+        add_posts_to_news_data(news_data, posts_data, message, potential_actions)
 
         # Write back to file
-        with open(news_filepath, 'w', encoding='utf-8') as f:
-            json.dump(news_data, f, indent=2)
+        with atomic_open(news_filepath, 'wb') as f:
+            f.write(orjson.dumps(news_data, option=orjson.OPT_INDENT_2))
 
-        logger.info(f"Successfully added {len(posts_data)} posts and {len(news_data['potential_actions'])} actions to {news_filepath}")
+        logger.info("Successfully added %s posts and %s actions to %s", len(posts_data), len(news_data['potential_actions']), news_filepath)
 
     except Exception as e:
-        logger.exception(f"Failed to add posts to news file: {e}")
+        logger.exception("Failed to add posts to news file: %s", e)
         return False
     return True
 
 
-def summarize_posts(news_filepath, posts_filepath):
+def summarize_posts_data(company_data, posts_filepath):
     """
-    Main function to process LinkedIn posts (JSON or CSV) and add growth indicators to news file.
+    Process LinkedIn posts (NDJSON, JSON or CSV) and add growth indicators, the
+    reachout message and potential actions to an in-memory company news dict.
 
     Args:
-        news_filepath: Path to the company news JSON file (e.g., "data/output/OnQ Software.json")
-        posts_filepath: Path to the LinkedIn posts file (e.g., "data/output/OnQ Software Linkedin Posts.json" or .csv)
+        company_data: Parsed company news JSON (mutated in place)
+        posts_filepath: Path to the LinkedIn posts file (e.g., "data/output/OnQ Software Linkedin Posts.jsonl" or .csv)
 
     Returns:
         list: Growth posts on success
         None: On failure or if inputs are missing
     """
-    # Handle missing inputs gracefully
-    if not news_filepath:
-        logger.warning("No news filepath provided, skipping summarization")
-        return None
-
     if not posts_filepath:
         logger.warning("No posts filepath provided, skipping LinkedIn post analysis")
         return None
 
     if not os.path.exists(posts_filepath):
-        logger.warning(f"Posts file not found: {posts_filepath}, skipping LinkedIn post analysis")
-        return None
-
-    if not os.path.exists(news_filepath):
-        logger.warning(f"News JSON file not found: {news_filepath}, cannot add posts")
+        logger.warning("Posts file not found: %s, skipping LinkedIn post analysis", posts_filepath)
         return None
 
-    logger.info(f"Processing posts from {posts_filepath}")
+    logger.info("Processing posts from %s", posts_filepath)
 
     try:
-        # Parse posts file (handles both JSON and CSV)
+        # Parse posts file (handles NDJSON, JSON and CSV)
         posts = parse_posts_file(posts_filepath)
-        logger.info(f"Found {len(posts)} posts")
+        logger.info("Found %s posts", len(posts))
 
         if not posts:
             logger.warning("No posts found, skipping analysis")
             return []
 
-        # Analyze all posts in one batch API call
-        logger.info(f"Analyzing all {len(posts)} posts in a single API call")
-        analyzed_posts = analyze_posts_batch_with_openai(posts)
+        # Posts without text (image-only posts, bare reposts) can't show growth; don't pay tokens for them
+        text_posts = [p for p in posts if _has_text(p)]
+        if len(text_posts) < len(posts):
+            logger.info("Skipping %s posts without text", len(posts) - len(text_posts))
 
-        if not analyzed_posts:
-            logger.warning("Post analysis returned no results")
-            return []
+        if text_posts:
+            # Analyze posts in batches of POSTS_BATCH_SIZE (one API call per batch)
+            logger.info("Analyzing %s posts in %s API call(s)", len(text_posts), math.ceil(len(text_posts) / POSTS_BATCH_SIZE))
+            analyzed_posts = analyze_posts_batch_with_openai(text_posts)
+
+            if not analyzed_posts:
+                logger.warning("Post analysis returned no results")
+                return []
+        else:
+            # Still generate the reachout message and actions from the news below
+            logger.warning("No posts with text, skipping post analysis")
+            analyzed_posts = []
 
         # Filter for growth indicators only and convert dates
         growth_posts = []
+        today = datetime.now()
         for analysis in analyzed_posts:
             if analysis.get('is_growth_indicator'):
-                date_from_analysis = analysis.get('date', 'Unknown')
-
-                # Check if date is already absolute (DD/MM/YYYY format) or relative (e.g., "2w")
-                if date_from_analysis and '/' in date_from_analysis and len(date_from_analysis) == 10:
-                    # Already absolute format (DD/MM/YYYY) - from API or Perplexity
-                    absolute_date = date_from_analysis
-                    relative_date = calculate_relative_date(absolute_date)
-                else:
-                    # Relative format (e.g., "2w") - from Playwright CSV
-                    relative_date = date_from_analysis
-                    absolute_date = convert_relative_date_to_absolute(relative_date)
+                absolute_date, relative_date = resolve_post_date(analysis.get('date', 'Unknown'), today)
 
                 growth_posts.append({
                     "summary": analysis.get('summary', ''),
                     "growth_type": analysis.get('growth_type', ''),
                     "date": absolute_date + " - " + relative_date
                 })
-                logger.info(f"Growth indicator found: {analysis.get('growth_type')} - {relative_date} -> {absolute_date}")
+                logger.info("Growth indicator found: %s - %s -> %s", analysis.get('growth_type'), relative_date, absolute_date)
 
-        logger.info(f"Found {len(growth_posts)} growth indicator posts out of {len(posts)} total posts")
+        logger.info("Found %s growth indicator posts out of %s total posts", len(growth_posts), len(posts))
 
         # Sort posts chronologically (latest first)
         growth_posts.sort(key=lambda x: parse_date_for_sorting(x['date']), reverse=True)
         logger.info("Sorted posts chronologically (latest first)")
 
-        # Load company data for generating actions and message
-        with open(news_filepath, 'r', encoding='utf-8') as f:
-            company_data = json.load(f)
         company_name = company_data.get('company', 'the company')
 
-        # Generate LinkedIn reachout message from growth posts and news
-        message = generate_reachout_message(company_name, growth_posts, company_data)
-
-        # Generate potential actions for investment analysts
-        potential_actions = generate_potential_actions(company_name, growth_posts, company_data)
+        # Generate the LinkedIn reachout message and analyst actions (concurrently)
+        message, potential_actions = generate_outreach(company_name, growth_posts, company_data)
 
-        # Add to news file
-        add_posts_to_news_file(news_filepath, growth_posts, message, potential_actions)
+        add_posts_to_news_data(company_data, growth_posts, message, potential_actions)
 
         logger.info("Processing complete!")
         return growth_posts
 
     except FileNotFoundError as e:
-        logger.error(f"File not found during summarization: {e}")
+        logger.error("File not found during summarization: %s", e)
+        return None
+    except Exception as e:
+        logger.exception("Error during summarization: %s", e)
+        return None
+
+
+def summarize_posts(news_filepath, posts_filepath):
+    """
+    Process LinkedIn posts (NDJSON, JSON or CSV) and add growth indicators to news file.
+    File-based wrapper around summarize_posts_data: one read and one write of the news JSON.
+
+    Args:
+        news_filepath: Path to the company news JSON file (e.g., "data/output/OnQ Software.json")
+        posts_filepath: Path to the LinkedIn posts file (e.g., "data/output/OnQ Software Linkedin Posts.jsonl" or .csv)
+
+    Returns:
+        list: Growth posts on success
+        None: On failure or if inputs are missing
+    """
+    # Handle missing inputs gracefully
+    if not news_filepath:
+        logger.warning("No news filepath provided, skipping summarization")
+        return None
+
+    if not os.path.exists(news_filepath):
+        logger.warning("News JSON file not found: %s, cannot add posts", news_filepath)
         return None
+
+    try:
+        with open(news_filepath, 'rb') as f:
+            company_data = orjson.loads(f.read())
     except Exception as e:
-        logger.exception(f"Error during summarization: {e}")
+        logger.exception("Could not read news file %s: %s", news_filepath, e)
         return None
 
+    growth_posts = summarize_posts_data(company_data, posts_filepath)
+
+    if growth_posts is not None:
+        try:
+            with atomic_open(news_filepath, 'wb') as f:
+                f.write(orjson.dumps(company_data, option=orjson.OPT_INDENT_2))
+            logger.info("Saved %s posts to %s", len(growth_posts), news_filepath)
+        except Exception as e:
+            logger.exception("Failed to add posts to news file: %s", e)
+            return None
+
+    return growth_posts
+
 
 # Backward compatibility wrapper
 def summarize_csv(news_filepath, posts_filepath):
@@ -734,6 +951,7 @@ def summarize_csv(news_filepath, posts_filepath):
 
 
 if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO)
     # Example usage
     summarize_csv(
         news_filepath="data/output/GRC Solutions.json",